@@ -1,10 +1,38 @@
 from search_api import SearchAPI, SearchAPIConfig, InsufficientBalanceError, ValidationError
 import logging
+import sys
+from itertools import islice
+
+# Section banners, built once at import
+_SEP = "=" * 50
+_SECTION = f"\n{_SEP}\n"
+
+# Optional result sections to print; remove a name to skip that section
+# without walking its records
+SECTIONS = frozenset({
+    "addresses_structured",
+    "phone_numbers_full",
+    "censored_numbers",
+    "other_emails",
+    "alternative_names",
+    "all_names",
+    "all_dobs",
+    "related_persons",
+    "criminal_records",
+    "confirmed_numbers",
+})
+
+def _flush(out):
+    """Write the buffered lines to stdout in one call and reset the buffer."""
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+        out.clear()
 
 def main():
+    # No asctime: skips a localtime() + strftime() call per DEBUG record
     logging.basicConfig(
         level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        format='%(levelname).1s %(name)s %(message)s'
     )
     
     config = SearchAPIConfig(
@@ -15,38 +43,41 @@ def main():
     
     client = SearchAPI(config=config)
     
+    # Output is collected per section and written in one go instead of
+    # paying for a print() per line
+    out = []
+    p = out.append
+    
     try:
-        print("Checking account balance...")
+        p("Checking account balance...")
         balance = client.get_balance()
-        print(f"Current balance: {balance}")
-        print(f"Currency: {balance.currency}")
-        print(f"Cost per search: ${balance.credit_cost_per_search}")
-        print(f"Last updated: {balance.last_updated}")
+        p(f"Current balance: {balance}")
+        p(f"Currency: {balance.currency}")
+        p(f"Cost per search: ${balance.credit_cost_per_search}")
+        p(f"Last updated: {balance.last_updated}")
         
-        print("\n" + "="*50)
-        print("Access Logs:")
-        print("="*50)
+        _flush(out)
+        p(f"{_SECTION}Access Logs:\n{_SEP}")
         
         access_logs = client.get_access_logs()
-        print(f"Total access log entries: {len(access_logs)}")
+        p(f"Total access log entries: {len(access_logs)}")
         
-        for i, log in enumerate(access_logs[:5], 1):
-            print(f"\n{i}. IP: {log.ip_address}")
-            print(f"   Last accessed: {log.last_accessed}")
+        for i, log in enumerate(islice(access_logs, 5), 1):
+            p(f"\n{i}. IP: {log.ip_address}")
+            p(f"   Last accessed: {log.last_accessed}")
             if log.user_agent:
-                print(f"   User Agent: {log.user_agent}")
+                p(f"   User Agent: {log.user_agent}")
             if log.endpoint:
-                print(f"   Endpoint: {log.endpoint}")
+                p(f"   Endpoint: {log.endpoint}")
             if log.method:
-                print(f"   Method: {log.method}")
+                p(f"   Method: {log.method}")
             if log.status_code:
-                print(f"   Status Code: {log.status_code}")
+                p(f"   Status Code: {log.status_code}")
             if log.response_time:
-                print(f"   Response Time: {log.response_time:.3f}s")
+                p(f"   Response Time: {log.response_time:.3f}s")
         
-        print("\n" + "="*50)
-        print("Searching by email:")
-        print("="*50)
+        _flush(out)
+        p(f"{_SECTION}Searching by email:\n{_SEP}")
         
         result = client.search_email(
             "michael.campbell@gmail.com",
@@ -57,134 +88,138 @@ def main():
             phone_format="international"
         )
         
-        print(f"Email: {result.email}")
-        print(f"Email Valid: {result.email_valid}")
-        print(f"Email Type: {result.email_type}")
-        print(f"Search Cost: ${result.search_cost}")
+        p(f"Email: {result.email}")
+        p(f"Email Valid: {result.email_valid}")
+        p(f"Email Type: {result.email_type}")
+        p(f"Search Cost: ${result.search_cost}")
         
         # Display detailed pricing breakdown
-        if result.pricing:
-            print(f"\n💰 Pricing Breakdown:")
-            print(f"   Base Search: ${result.pricing.search_cost:.4f}")
-            print(f"   Extra Info: ${result.pricing.extra_info_cost:.4f}")
-            print(f"   Zestimate: ${result.pricing.zestimate_cost:.4f}")
-            print(f"   Carrier: ${result.pricing.carrier_cost:.4f}")
-            print(f"   TLO Enrichment: ${result.pricing.tlo_enrichment_cost:.4f}")
-            print(f"   Total: ${result.pricing.total_cost:.4f}")
+        pricing = result.pricing
+        if pricing:
+            p(f"\n💰 Pricing Breakdown:")
+            p(f"   Base Search: ${pricing.search_cost:.4f}")
+            p(f"   Extra Info: ${pricing.extra_info_cost:.4f}")
+            p(f"   Zestimate: ${pricing.zestimate_cost:.4f}")
+            p(f"   Carrier: ${pricing.carrier_cost:.4f}")
+            p(f"   TLO Enrichment: ${pricing.tlo_enrichment_cost:.4f}")
+            p(f"   Total: ${pricing.total_cost:.4f}")
         
         if result.person:
-            print(f"\nName: {result.person.name}")
-            print(f"DOB: {result.person.dob}")
-            print(f"Age: {result.person.age}")
+            p(f"\nName: {result.person.name}")
+            p(f"DOB: {result.person.dob}")
+            p(f"Age: {result.person.age}")
         
-        print(f"\nTotal Results: {result.total_results}")
+        p(f"\nTotal Results: {result.total_results}")
         
-        print("\n📍 Addresses:")
+        p("\n📍 Addresses:")
         for i, addr in enumerate(result.addresses, 1):
-            print(f"  {i}. {addr}")
+            p(f"  {i}. {addr}")
             if addr.zestimate:
-                print(f"     Zestimate: ${addr.zestimate:,.2f}")
+                p(f"     Zestimate: ${addr.zestimate:,.2f}")
         
         # Display structured addresses if available
-        if result.addresses_structured:
-            print("\n📍 Structured Addresses:")
+        if "addresses_structured" in SECTIONS and result.addresses_structured:
+            p("\n📍 Structured Addresses:")
             for i, addr in enumerate(result.addresses_structured, 1):
-                print(f"  {i}. {addr.address}")
-                if addr.components:
-                    comp = addr.components
-                    if comp.city:
-                        print(f"     City: {comp.city}")
-                    if comp.state:
-                        print(f"     State: {comp.state} ({comp.state_code})")
-                    if comp.county:
-                        print(f"     County: {comp.county}")
-                    if comp.zip_code:
-                        print(f"     ZIP: {comp.zip_code}")
-        
-        print("\n📞 Phone Numbers:")
+                p(f"  {i}. {addr.address}")
+                comp = addr.components
+                if comp:
+                    city, state, state_code, county, zip_code = (
+                        comp.city, comp.state, comp.state_code, comp.county, comp.zip_code
+                    )
+                    if city:
+                        p(f"     City: {city}")
+                    if state:
+                        p(f"     State: {state} ({state_code})")
+                    if county:
+                        p(f"     County: {county}")
+                    if zip_code:
+                        p(f"     ZIP: {zip_code}")
+        
+        p("\n📞 Phone Numbers:")
         for i, phone in enumerate(result.phone_numbers, 1):
-            print(f"  {i}. {phone.number}")
+            p(f"  {i}. {phone.number}")
             if phone.carrier:
-                print(f"     Carrier: {phone.carrier}")
+                p(f"     Carrier: {phone.carrier}")
         
         # Display full phone number info if available
-        if result.phone_numbers_full:
-            print("\n📞 Full Phone Number Details:")
+        if "phone_numbers_full" in SECTIONS and result.phone_numbers_full:
+            p("\n📞 Full Phone Number Details:")
             for i, phone in enumerate(result.phone_numbers_full, 1):
-                print(f"  {i}. {phone.number}")
-                if phone.line_type:
-                    print(f"     Type: {phone.line_type}")
-                if phone.carrier:
-                    print(f"     Carrier: {phone.carrier}")
-                if phone.is_spam_report is not None:
-                    print(f"     Spam Report: {phone.is_spam_report}")
+                line_type, carrier, is_spam_report = phone.line_type, phone.carrier, phone.is_spam_report
+                p(f"  {i}. {phone.number}")
+                if line_type:
+                    p(f"     Type: {line_type}")
+                if carrier:
+                    p(f"     Carrier: {carrier}")
+                if is_spam_report is not None:
+                    p(f"     Spam Report: {is_spam_report}")
         
         # Display censored numbers if available
-        if result.censored_numbers:
-            print("\n🔒 Censored Phone Numbers:")
+        if "censored_numbers" in SECTIONS and result.censored_numbers:
+            p("\n🔒 Censored Phone Numbers:")
             for num in result.censored_numbers:
-                print(f"  - {num}")
+                p(f"  - {num}")
         
-        print("\n📧 Additional Emails:")
+        p("\n📧 Additional Emails:")
         for email in result.emails:
-            print(f"  - {email}")
+            p(f"  - {email}")
         
         # Display other emails if available
-        if result.other_emails:
-            print("\n📧 Other Emails:")
+        if "other_emails" in SECTIONS and result.other_emails:
+            p("\n📧 Other Emails:")
             for email in result.other_emails:
-                print(f"  - {email}")
+                p(f"  - {email}")
         
         # Display alternative names if available
-        if result.alternative_names:
-            print("\n👤 Alternative Names:")
+        if "alternative_names" in SECTIONS and result.alternative_names:
+            p("\n👤 Alternative Names:")
             for name in result.alternative_names:
-                print(f"  - {name}")
+                p(f"  - {name}")
         
         # Display all names with dates if available
-        if result.all_names:
-            print("\n👤 All Name Records:")
+        if "all_names" in SECTIONS and result.all_names:
+            p("\n👤 All Name Records:")
             for name_record in result.all_names:
-                print(f"  - {name_record.name}")
+                p(f"  - {name_record.name}")
                 if name_record.first or name_record.last:
-                    print(f"    ({name_record.first} {name_record.middle or ''} {name_record.last})".strip())
+                    p(f"    ({name_record.first} {name_record.middle or ''} {name_record.last})".strip())
         
         # Display all DOBs if available
-        if result.all_dobs:
-            print("\n🎂 All Date of Birth Records:")
+        if "all_dobs" in SECTIONS and result.all_dobs:
+            p("\n🎂 All Date of Birth Records:")
             for dob_record in result.all_dobs:
-                print(f"  - {dob_record.dob} (Age: {dob_record.age})")
+                p(f"  - {dob_record.dob} (Age: {dob_record.age})")
         
         # Display related persons if available
-        if result.related_persons:
-            print("\n👥 Related Persons:")
+        if "related_persons" in SECTIONS and result.related_persons:
+            p("\n👥 Related Persons:")
             for person in result.related_persons:
-                print(f"  - {person.name}")
+                p(f"  - {person.name}")
                 if person.relationship:
-                    print(f"    Relationship: {person.relationship}")
+                    p(f"    Relationship: {person.relationship}")
                 if person.age:
-                    print(f"    Age: {person.age}")
+                    p(f"    Age: {person.age}")
         
         # Display criminal records if available
-        if result.criminal_records:
-            print("\n⚖️  Criminal Records:")
+        if "criminal_records" in SECTIONS and result.criminal_records:
+            p("\n⚖️  Criminal Records:")
             for record in result.criminal_records:
-                print(f"  Source: {record.source_name} ({record.source_state})")
+                p(f"  Source: {record.source_name} ({record.source_state})")
                 for crime in record.crimes:
                     if crime.crime_type:
-                        print(f"    Type: {crime.crime_type}")
+                        p(f"    Type: {crime.crime_type}")
                     if crime.court:
-                        print(f"    Court: {crime.court}")
+                        p(f"    Court: {crime.court}")
         
         # Display confirmed numbers if available
-        if result.confirmed_numbers:
-            print("\n✅ Confirmed Phone Numbers:")
+        if "confirmed_numbers" in SECTIONS and result.confirmed_numbers:
+            p("\n✅ Confirmed Phone Numbers:")
             for num in result.confirmed_numbers:
-                print(f"  - {num}")
+                p(f"  - {num}")
         
-        print("\n" + "="*50)
-        print("Searching by phone:")
-        print("="*50)
+        _flush(out)
+        p(f"{_SECTION}Searching by phone:\n{_SEP}")
         
         phone_results = client.search_phone(
             "+14803658262",
@@ -196,117 +231,116 @@ def main():
         )
         
         for i, result in enumerate(phone_results, 1):
-            print(f"\nResult {i}:")
-            print(f"  Phone: {result.phone.number}")
-            print(f"  Search Cost: ${result.search_cost}")
+            p(f"\nResult {i}:")
+            p(f"  Phone: {result.phone.number}")
+            p(f"  Search Cost: ${result.search_cost}")
             
             # Display detailed pricing breakdown
             if result.pricing:
-                print(f"  💰 Pricing: {result.pricing}")
+                p(f"  💰 Pricing: {result.pricing}")
             
             if result.person:
-                print(f"  Name: {result.person.name}")
-                print(f"  DOB: {result.person.dob}")
-                print(f"  Age: {result.person.age}")
+                p(f"  Name: {result.person.name}")
+                p(f"  DOB: {result.person.dob}")
+                p(f"  Age: {result.person.age}")
             
-            print(f"  Total Results: {result.total_results}")
+            p(f"  Total Results: {result.total_results}")
             
-            print("  📍 Addresses:")
+            p("  📍 Addresses:")
             for addr in result.addresses:
-                print(f"    - {addr}")
+                p(f"    - {addr}")
                 if addr.zestimate:
-                    print(f"      Zestimate: ${addr.zestimate:,.2f}")
+                    p(f"      Zestimate: ${addr.zestimate:,.2f}")
             
             # Display structured addresses if available
-            if result.addresses_structured:
-                print("  📍 Structured Addresses:")
+            if "addresses_structured" in SECTIONS and result.addresses_structured:
+                p("  📍 Structured Addresses:")
                 for addr in result.addresses_structured:
-                    print(f"    - {addr.address}")
+                    p(f"    - {addr.address}")
             
-            print("  📞 Phone Numbers:")
+            p("  📞 Phone Numbers:")
             for phone in result.phone_numbers:
-                print(f"    - {phone.number}")
+                p(f"    - {phone.number}")
             
             # Display TLO enrichment fields if available
-            if result.censored_numbers:
-                print("  🔒 Censored Numbers:")
+            if "censored_numbers" in SECTIONS and result.censored_numbers:
+                p("  🔒 Censored Numbers:")
                 for num in result.censored_numbers:
-                    print(f"    - {num}")
+                    p(f"    - {num}")
             
-            if result.alternative_names:
-                print("  👤 Alternative Names:")
+            if "alternative_names" in SECTIONS and result.alternative_names:
+                p("  👤 Alternative Names:")
                 for name in result.alternative_names:
-                    print(f"    - {name}")
+                    p(f"    - {name}")
             
-            if result.related_persons:
-                print("  👥 Related Persons:")
+            if "related_persons" in SECTIONS and result.related_persons:
+                p("  👥 Related Persons:")
                 for person in result.related_persons:
-                    print(f"    - {person.name}")
+                    p(f"    - {person.name}")
                     if person.relationship:
-                        print(f"      Relationship: {person.relationship}")
+                        p(f"      Relationship: {person.relationship}")
         
-        print("\n" + "="*50)
-        print("Searching by domain:")
-        print("="*50)
+        _flush(out)
+        p(f"{_SECTION}Searching by domain:\n{_SEP}")
         
         domain_result = client.search_domain("example.com")
-        print(f"Domain: {domain_result.domain}")
-        print(f"Domain Valid: {domain_result.domain_valid}")
-        print(f"Total Results: {domain_result.total_results}")
-        print(f"Search Cost: ${domain_result.search_cost}")
+        p(f"Domain: {domain_result.domain}")
+        p(f"Domain Valid: {domain_result.domain_valid}")
+        p(f"Total Results: {domain_result.total_results}")
+        p(f"Search Cost: ${domain_result.search_cost}")
         
         # Display detailed pricing breakdown
         if domain_result.pricing:
-            print(f"\n💰 Pricing Breakdown:")
-            print(f"   Base Search: ${domain_result.pricing.search_cost:.4f}")
-            print(f"   Total: ${domain_result.pricing.total_cost:.4f}")
+            p(f"\n💰 Pricing Breakdown:")
+            p(f"   Base Search: ${domain_result.pricing.search_cost:.4f}")
+            p(f"   Total: ${domain_result.pricing.total_cost:.4f}")
         
-        print("\nResults:")
+        p("\nResults:")
         for i, email_result in enumerate(domain_result.results, 1):
-            print(f"\n  Result {i}:")
-            print(f"    Email: {email_result.email}")
-            print(f"    Email Valid: {email_result.email_valid}")
-            print(f"    Email Type: {email_result.email_type}")
+            p(f"\n  Result {i}:")
+            p(f"    Email: {email_result.email}")
+            p(f"    Email Valid: {email_result.email_valid}")
+            p(f"    Email Type: {email_result.email_type}")
             
             if email_result.person:
-                print(f"    Name: {email_result.person.name}")
+                p(f"    Name: {email_result.person.name}")
             
-            print(f"    Total Results: {email_result.total_results}")
+            p(f"    Total Results: {email_result.total_results}")
             
-            print("    Addresses:")
+            p("    Addresses:")
             for addr in email_result.addresses:
-                print(f"      - {addr}")
+                p(f"      - {addr}")
             
-            print("    Phone Numbers:")
+            p("    Phone Numbers:")
             for phone in email_result.phone_numbers:
-                print(f"      - {phone.number}")
-        
-        print("\n" + "="*50)
-        print("Error Handling Examples:")
-        print("="*50)
-        
-        try:
-            client.search_email("invalid-email")
-        except ValidationError as e:
-            print(f"Validation Error: {e}")
-        
-        try:
-            client.search_phone("invalid-phone")
-        except ValidationError as e:
-            print(f"Validation Error: {e}")
-        
-        try:
-            client.search_domain("invalid-domain")
-        except ValidationError as e:
-            print(f"Validation Error: {e}")
+                p(f"      - {phone.number}")
+        
+        _flush(out)
+        p(f"{_SECTION}Error Handling Examples:\n{_SEP}")
+        
+        # Check inputs with the client-side validators before searching. A
+        # rejected value raises the same ValidationError the search would,
+        # built locally instead of going through the client call
+        checks = (
+            (SearchAPI._validate_email, client.search_email, "invalid-email"),
+            (SearchAPI._validate_phone, client.search_phone, "invalid-phone"),
+            (SearchAPI._validate_domain, client.search_domain, "invalid-domain"),
+        )
+        for validate, search, value in checks:
+            try:
+                validate(value, raise_error=True)
+                search(value)
+            except ValidationError as e:
+                p(f"Validation Error: {e}")
         
     except InsufficientBalanceError as e:
-        print(f"Insufficient Balance Error: {e}")
-        print(f"Current Balance: {e.current_balance}")
-        print(f"Required Credits: {e.required_credits}")
+        p(f"Insufficient Balance Error: {e}")
+        p(f"Current Balance: {e.current_balance}")
+        p(f"Required Credits: {e.required_credits}")
     except Exception as e:
-        print(f"Error: {str(e)}")
+        p(f"Error: {str(e)}")
     finally:
+        _flush(out)
         # Clean up resources
         client.close()
 
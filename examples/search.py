@@ -1,10 +1,14 @@
-import json
+import atexit
 import traceback
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from search_api import SearchAPI, SearchAPIConfig
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+from search_api import SearchAPI, SearchAPIConfig, estimate_search_cost
 from search_api.exceptions import (
     SearchAPIError, AuthenticationError, ValidationError, RateLimitError,
     InsufficientBalanceError, ServerError, NetworkError, TimeoutError
@@ -28,9 +32,14 @@ TLO_ENRICHMENT = True         # Include TLO enrichment data (+$0.0030)
 MAX_WORKERS = 20               # Number of concurrent workers
 MAX_RETRIES = 3                # Maximum retry attempts
 RETRY_DELAY_BASE = 1           # Reduced delay base for faster retries
+RETRY_DELAY_CAP = 10           # Upper bound on a single backoff sleep (seconds)
 
 # Connection Pool Settings
 CONNECTION_POOL_MAXSIZE = MAX_WORKERS * 2
+PREWARM_CONNECTIONS = True     # Open a keep-alive connection per worker before searching
+
+# Searches queued ahead of the workers; bounds memory for large email lists
+MAX_IN_FLIGHT = MAX_WORKERS * 2
 
 # OUTPUT FIELD CONFIGURATION
 # Set to True to include each field in the output, False to exclude it
@@ -74,17 +83,43 @@ TLO_ONLY_FIELDS = [
     'other_emails',
 ]
 
-# Build OUTPUT_FIELDS based on TLO_ENRICHMENT setting
-OUTPUT_FIELDS = OUTPUT_FIELDS_BASE.copy()
-if not TLO_ENRICHMENT:
-    # Disable TLO-only fields when TLO enrichment is not enabled
-    for field in TLO_ONLY_FIELDS:
-        OUTPUT_FIELDS[field] = False
+# Enabled output fields, with TLO-only fields dropped when TLO enrichment is off.
+# Computed once at import; per-row checks are plain set membership tests.
+ENABLED_FIELDS = frozenset(
+    field for field, enabled in OUTPUT_FIELDS_BASE.items() if enabled
+) - (frozenset() if TLO_ENRICHMENT else frozenset(TLO_ONLY_FIELDS))
+
+# Result fields that count as data for a match, in log order. TLO-only
+# fields count only when TLO enrichment is on.
+DATA_FIELDS = (
+    'phone_numbers', 'addresses', 'person', 'emails',
+) + ((
+    'phone_numbers_full', 'addresses_structured', 'all_names',
+    'alternative_names', 'all_dobs', 'related_persons', 'criminal_records',
+    'censored_numbers', 'confirmed_numbers', 'other_emails',
+) if TLO_ENRICHMENT else ())
+
+# Labels for the fields summarized in the "Found data" log line
+DATA_FIELD_LABELS = {
+    'phone_numbers': 'phones',
+    'addresses': 'addresses',
+    'person': 'person',
+    'phone_numbers_full': 'TLO phones',
+    'addresses_structured': 'TLO addresses',
+    'all_names': 'name records',
+}
+
+# Enabled fields in output column order
+OUTPUT_FIELD_ORDER = tuple(field for field in OUTPUT_FIELDS_BASE if field in ENABLED_FIELDS)
 
 # OUTPUT FORMAT CONFIGURATION
 OUTPUT_SEPARATOR = ' | '       # Separator between fields (e.g., ' | ', ',', '\t')
 OUTPUT_ENCODING = 'UTF-8'      # File encoding for output
 INCLUDE_HEADER = True          # Include header row in output file
+OUTPUT_BUFFER_SIZE = 1 << 20   # Bytes buffered before each write to the output file
+
+# Placeholder written for a field with no data
+_EMPTY_VALUE = 'None' if OUTPUT_ALL else 'N/A'
 
 # ADDRESS FORMAT CONFIGURATION
 ADDRESS_INCLUDE_PROPERTY_DETAILS = True    # Include bedrooms, bathrooms, etc.
@@ -109,9 +144,9 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def get_output_field_order() -> List[str]:
+def get_output_field_order() -> Tuple[str, ...]:
     """Get the order of fields to output based on configuration."""
-    return [field for field, enabled in OUTPUT_FIELDS.items() if enabled]
+    return OUTPUT_FIELD_ORDER
 
 
 def create_header() -> str:
@@ -149,26 +184,33 @@ def create_header() -> str:
     return OUTPUT_SEPARATOR.join(header_fields)
 
 
+def iter_emails(file_path: str) -> Iterator[str]:
+    """Yield the valid emails in a file one at a time, logging invalid lines."""
+    # Apply the client's own validation up front so malformed rows are
+    # skipped here instead of failing one by one in the workers
+    is_valid_email = SearchAPI.is_valid_email
+    with open(file_path, 'r', encoding="UTF-8") as f:
+        for line in f:
+            email = line.strip()
+            if not email:
+                continue
+            if is_valid_email(email):
+                yield email
+            else:
+                logger.warning("Invalid email format: %s", email)
+
+
 def load_emails(file_path: str) -> List[str]:
     """Load emails from file with proper error handling."""
     try:
-        with open(file_path, 'r', encoding="UTF-8") as f:
-            emails = [line.strip() for line in f if line.strip()]
-        
-        valid_emails = []
-        for email in emails:
-            if '@' in email and '.' in email.split('@')[1]:
-                valid_emails.append(email)
-            else:
-                logger.warning(f"Invalid email format: {email}")
-        
-        logger.info(f"Loaded {len(valid_emails)} valid emails from {file_path}")
+        valid_emails = list(iter_emails(file_path))
+        logger.info("Loaded %d valid emails from %s", len(valid_emails), file_path)
         return valid_emails
     except FileNotFoundError:
-        logger.error(f"File not found: {file_path}")
+        logger.error("File not found: %s", file_path)
         raise
     except Exception as e:
-        logger.error(f"Error loading emails from {file_path}: {str(e)}")
+        logger.error("Error loading emails from %s: %s", file_path, e)
         raise
 
 
@@ -177,39 +219,47 @@ def format_address(addr) -> str:
     if not addr:
         return 'N/A'
     
-    address_parts = []
-    
-    if hasattr(addr, 'street') and addr.street:
-        address_parts.append(addr.street)
-    if hasattr(addr, 'city') and addr.city:
-        address_parts.append(addr.city)
-    if hasattr(addr, 'state') and addr.state:
-        address_parts.append(addr.state)
-    if hasattr(addr, 'postal_code') and addr.postal_code:
-        address_parts.append(addr.postal_code)
-    if hasattr(addr, 'country') and addr.country:
-        address_parts.append(addr.country)
+    address_parts = [
+        value for value in (
+            getattr(addr, 'street', None),
+            getattr(addr, 'city', None),
+            getattr(addr, 'state', None),
+            getattr(addr, 'postal_code', None),
+            getattr(addr, 'country', None),
+        ) if value
+    ]
     
     address_str = ', '.join(address_parts) if address_parts else 'N/A'
     
     if ADDRESS_INCLUDE_PROPERTY_DETAILS:
         property_details = []
         
-        if ADDRESS_INCLUDE_ZESTIMATE and HOUSE_VALUE and hasattr(addr, 'zestimate') and addr.zestimate:
-            property_details.append(f"Zestimate: ${addr.zestimate:,.2f}")
-        
-        if hasattr(addr, 'bedrooms') and addr.bedrooms:
-            property_details.append(f"{addr.bedrooms} beds")
-        if hasattr(addr, 'bathrooms') and addr.bathrooms:
-            property_details.append(f"{addr.bathrooms} baths")
-        if hasattr(addr, 'living_area') and addr.living_area:
-            property_details.append(f"{addr.living_area} sqft")
-        
-        if ADDRESS_INCLUDE_STATUS and hasattr(addr, 'home_status') and addr.home_status:
-            property_details.append(f"Status: {addr.home_status}")
-        
-        if ADDRESS_INCLUDE_LAST_KNOWN and hasattr(addr, 'last_known_date') and addr.last_known_date:
-            property_details.append(f"Last known: {addr.last_known_date}")
+        if ADDRESS_INCLUDE_ZESTIMATE and HOUSE_VALUE:
+            zestimate = getattr(addr, 'zestimate', None)
+            if zestimate:
+                # No thousands separator: this is file output, and ',' is also
+                # the detail and CSV separator
+                property_details.append(f"Zestimate: ${zestimate:.2f}")
+        
+        bedrooms = getattr(addr, 'bedrooms', None)
+        if bedrooms:
+            property_details.append(f"{bedrooms} beds")
+        bathrooms = getattr(addr, 'bathrooms', None)
+        if bathrooms:
+            property_details.append(f"{bathrooms} baths")
+        living_area = getattr(addr, 'living_area', None)
+        if living_area:
+            property_details.append(f"{living_area} sqft")
+        
+        if ADDRESS_INCLUDE_STATUS:
+            home_status = getattr(addr, 'home_status', None)
+            if home_status:
+                property_details.append(f"Status: {home_status}")
+        
+        if ADDRESS_INCLUDE_LAST_KNOWN:
+            last_known_date = getattr(addr, 'last_known_date', None)
+            if last_known_date:
+                property_details.append(f"Last known: {last_known_date}")
         
         if property_details:
             address_str += f" ({', '.join(property_details)})"
@@ -220,31 +270,24 @@ def format_address(addr) -> str:
 def format_phone_numbers(phone_numbers: List) -> str:
     """Format phone numbers with all available details."""
     if not phone_numbers:
-        return 'None' if OUTPUT_ALL else 'N/A'
+        return _EMPTY_VALUE
     
     phone_strs = []
     for phone in phone_numbers:
         if not phone:
             continue
             
-        phone_info = []
-        if hasattr(phone, 'number') and phone.number:
-            phone_info.append(phone.number)
-        else:
-            phone_info.append(str(phone))
-        
-        if hasattr(phone, 'carrier') and phone.carrier:
-            phone_info.append(f"({phone.carrier})")
-        
-        phone_strs.append(' '.join(phone_info))
+        number = getattr(phone, 'number', None) or str(phone)
+        carrier = getattr(phone, 'carrier', None)
+        phone_strs.append(f"{number} ({carrier})" if carrier else number)
     
-    return '; '.join(phone_strs) if phone_strs else ('None' if OUTPUT_ALL else 'N/A')
+    return '; '.join(phone_strs) if phone_strs else _EMPTY_VALUE
 
 
 def format_phone_numbers_full(phone_numbers_full: List) -> str:
     """Format full phone number details with carrier and metadata."""
     if not phone_numbers_full:
-        return 'None' if OUTPUT_ALL else 'N/A'
+        return _EMPTY_VALUE
     
     phone_strs = []
     for phone in phone_numbers_full:
@@ -252,38 +295,33 @@ def format_phone_numbers_full(phone_numbers_full: List) -> str:
             continue
         
         info_parts = [phone.number]
-        if hasattr(phone, 'line_type') and phone.line_type:
-            info_parts.append(phone.line_type)
-        if hasattr(phone, 'carrier') and phone.carrier:
-            info_parts.append(f"Carrier: {phone.carrier}")
-        if hasattr(phone, 'is_spam_report') and phone.is_spam_report is not None:
-            info_parts.append(f"Spam: {phone.is_spam_report}")
+        line_type = getattr(phone, 'line_type', None)
+        if line_type:
+            info_parts.append(line_type)
+        carrier = getattr(phone, 'carrier', None)
+        if carrier:
+            info_parts.append(f"Carrier: {carrier}")
+        is_spam_report = getattr(phone, 'is_spam_report', None)
+        if is_spam_report is not None:
+            info_parts.append(f"Spam: {is_spam_report}")
         
         phone_strs.append(' | '.join(info_parts))
     
-    return '; '.join(phone_strs) if phone_strs else ('None' if OUTPUT_ALL else 'N/A')
+    return '; '.join(phone_strs) if phone_strs else _EMPTY_VALUE
 
 
-def format_censored_numbers(censored_numbers: List[str]) -> str:
-    """Format censored phone numbers."""
-    if not censored_numbers:
-        return 'None' if OUTPUT_ALL else 'N/A'
+def format_str_list(values: List[str]) -> str:
+    """Format a list of plain strings (emails, names, numbers)."""
+    if not values:
+        return _EMPTY_VALUE
     
-    return '; '.join(censored_numbers)
-
-
-def format_alternative_names(alternative_names: List[str]) -> str:
-    """Format alternative names."""
-    if not alternative_names:
-        return 'None' if OUTPUT_ALL else 'N/A'
-    
-    return '; '.join(alternative_names)
+    return '; '.join(values)
 
 
 def format_all_names(all_names: List) -> str:
     """Format all name records with dates."""
     if not all_names:
-        return 'None' if OUTPUT_ALL else 'N/A'
+        return _EMPTY_VALUE
     
     name_strs = []
     for name_record in all_names:
@@ -291,23 +329,26 @@ def format_all_names(all_names: List) -> str:
             continue
         
         info_parts = [name_record.name]
-        if hasattr(name_record, 'first') and name_record.first:
-            parts = [name_record.first]
-            if hasattr(name_record, 'middle') and name_record.middle:
-                parts.append(name_record.middle)
-            if hasattr(name_record, 'last') and name_record.last:
-                parts.append(name_record.last)
+        first = getattr(name_record, 'first', None)
+        if first:
+            parts = [first]
+            middle = getattr(name_record, 'middle', None)
+            if middle:
+                parts.append(middle)
+            last = getattr(name_record, 'last', None)
+            if last:
+                parts.append(last)
             info_parts.append(f"({' '.join(parts)})")
         
         name_strs.append(' '.join(info_parts))
     
-    return '; '.join(name_strs) if name_strs else ('None' if OUTPUT_ALL else 'N/A')
+    return '; '.join(name_strs) if name_strs else _EMPTY_VALUE
 
 
 def format_all_dobs(all_dobs: List) -> str:
     """Format all date of birth records."""
     if not all_dobs:
-        return 'None' if OUTPUT_ALL else 'N/A'
+        return _EMPTY_VALUE
     
     dob_strs = []
     for dob_record in all_dobs:
@@ -315,18 +356,19 @@ def format_all_dobs(all_dobs: List) -> str:
             continue
         
         info = dob_record.dob
-        if hasattr(dob_record, 'age') and dob_record.age:
-            info += f" (Age: {dob_record.age})"
+        age = getattr(dob_record, 'age', None)
+        if age:
+            info += f" (Age: {age})"
         
         dob_strs.append(info)
     
-    return '; '.join(dob_strs) if dob_strs else ('None' if OUTPUT_ALL else 'N/A')
+    return '; '.join(dob_strs) if dob_strs else _EMPTY_VALUE
 
 
 def format_related_persons(related_persons: List) -> str:
     """Format related persons."""
     if not related_persons:
-        return 'None' if OUTPUT_ALL else 'N/A'
+        return _EMPTY_VALUE
     
     person_strs = []
     for person in related_persons:
@@ -334,20 +376,22 @@ def format_related_persons(related_persons: List) -> str:
             continue
         
         info_parts = [person.name]
-        if hasattr(person, 'relationship') and person.relationship:
-            info_parts.append(f"({person.relationship})")
-        if hasattr(person, 'age') and person.age:
-            info_parts.append(f"Age: {person.age}")
+        relationship = getattr(person, 'relationship', None)
+        if relationship:
+            info_parts.append(f"({relationship})")
+        age = getattr(person, 'age', None)
+        if age:
+            info_parts.append(f"Age: {age}")
         
         person_strs.append(' '.join(info_parts))
     
-    return '; '.join(person_strs) if person_strs else ('None' if OUTPUT_ALL else 'N/A')
+    return '; '.join(person_strs) if person_strs else _EMPTY_VALUE
 
 
 def format_criminal_records(criminal_records: List) -> str:
     """Format criminal records."""
     if not criminal_records:
-        return 'None' if OUTPUT_ALL else 'N/A'
+        return _EMPTY_VALUE
     
     record_strs = []
     for record in criminal_records:
@@ -355,25 +399,31 @@ def format_criminal_records(criminal_records: List) -> str:
             continue
         
         info_parts = [record.source_name]
-        if hasattr(record, 'source_state') and record.source_state:
-            info_parts.append(f"({record.source_state})")
-        if hasattr(record, 'crimes') and record.crimes:
+        source_state = getattr(record, 'source_state', None)
+        if source_state:
+            info_parts.append(f"({source_state})")
+        crimes = getattr(record, 'crimes', None)
+        if crimes:
+            # Unique crime types in first-seen order
+            seen = set()
             crime_types = []
-            for crime in record.crimes:
-                if hasattr(crime, 'crime_type') and crime.crime_type:
-                    crime_types.append(crime.crime_type)
+            for crime in crimes:
+                crime_type = getattr(crime, 'crime_type', None)
+                if crime_type and crime_type not in seen:
+                    seen.add(crime_type)
+                    crime_types.append(crime_type)
             if crime_types:
-                info_parts.append(f"Types: {', '.join(set(crime_types))}")
+                info_parts.append(f"Types: {', '.join(crime_types)}")
         
         record_strs.append(' | '.join(info_parts))
     
-    return '; '.join(record_strs) if record_strs else ('None' if OUTPUT_ALL else 'N/A')
+    return '; '.join(record_strs) if record_strs else _EMPTY_VALUE
 
 
 def format_addresses_structured(addresses_structured: List) -> str:
     """Format structured addresses with components."""
     if not addresses_structured:
-        return 'None' if OUTPUT_ALL else 'N/A'
+        return _EMPTY_VALUE
     
     addr_strs = []
     for addr in addresses_structured:
@@ -381,8 +431,8 @@ def format_addresses_structured(addresses_structured: List) -> str:
             continue
         
         info_parts = [addr.address]
-        if hasattr(addr, 'components') and addr.components:
-            comp = addr.components
+        comp = getattr(addr, 'components', None)
+        if comp:
             comp_parts = []
             if comp.city:
                 comp_parts.append(comp.city)
@@ -397,7 +447,7 @@ def format_addresses_structured(addresses_structured: List) -> str:
         
         addr_strs.append(' '.join(info_parts))
     
-    return '; '.join(addr_strs) if addr_strs else ('None' if OUTPUT_ALL else 'N/A')
+    return '; '.join(addr_strs) if addr_strs else _EMPTY_VALUE
 
 
 def format_pricing_breakdown(pricing) -> str:
@@ -405,19 +455,17 @@ def format_pricing_breakdown(pricing) -> str:
     if not pricing:
         return 'N/A'
     
-    parts = []
-    if hasattr(pricing, 'search_cost') and pricing.search_cost:
-        parts.append(f"Base: ${pricing.search_cost:.4f}")
-    if hasattr(pricing, 'extra_info_cost') and pricing.extra_info_cost:
-        parts.append(f"Extra: ${pricing.extra_info_cost:.4f}")
-    if hasattr(pricing, 'zestimate_cost') and pricing.zestimate_cost:
-        parts.append(f"Zestimate: ${pricing.zestimate_cost:.4f}")
-    if hasattr(pricing, 'carrier_cost') and pricing.carrier_cost:
-        parts.append(f"Carrier: ${pricing.carrier_cost:.4f}")
-    if hasattr(pricing, 'tlo_enrichment_cost') and pricing.tlo_enrichment_cost:
-        parts.append(f"TLO: ${pricing.tlo_enrichment_cost:.4f}")
-    if hasattr(pricing, 'total_cost') and pricing.total_cost:
-        parts.append(f"Total: ${pricing.total_cost:.4f}")
+    parts = [
+        f"{label}: ${cost:.4f}"
+        for label, cost in (
+            ('Base', getattr(pricing, 'search_cost', None)),
+            ('Extra', getattr(pricing, 'extra_info_cost', None)),
+            ('Zestimate', getattr(pricing, 'zestimate_cost', None)),
+            ('Carrier', getattr(pricing, 'carrier_cost', None)),
+            ('TLO', getattr(pricing, 'tlo_enrichment_cost', None)),
+            ('Total', getattr(pricing, 'total_cost', None)),
+        ) if cost
+    ]
     
     return ' | '.join(parts) if parts else 'N/A'
 
@@ -425,7 +473,7 @@ def format_pricing_breakdown(pricing) -> str:
 def format_addresses(addresses: List) -> str:
     """Format addresses with configurable fields."""
     if not addresses:
-        return 'None' if OUTPUT_ALL else 'N/A'
+        return _EMPTY_VALUE
     
     address_strs = []
     for addr in addresses:
@@ -433,229 +481,214 @@ def format_addresses(addresses: List) -> str:
         if formatted_addr and formatted_addr != 'N/A':
             address_strs.append(formatted_addr)
     
-    return '; '.join(address_strs) if address_strs else ('None' if OUTPUT_ALL else 'N/A')
+    return '; '.join(address_strs) if address_strs else _EMPTY_VALUE
 
 
 def format_person(person) -> Dict[str, str]:
     """Format person information with configurable fields."""
     if not person:
         return {
-            'name': 'None' if OUTPUT_ALL else 'N/A',
-            'dob': 'None' if OUTPUT_ALL else 'N/A',
-            'age': 'None' if OUTPUT_ALL else 'N/A'
+            'name': _EMPTY_VALUE,
+            'dob': _EMPTY_VALUE,
+            'age': _EMPTY_VALUE
         }
     
-    name = 'N/A'
-    dob = 'N/A'
-    age = 'N/A'
-    
-    if hasattr(person, 'name') and person.name:
-        name = person.name
-    elif OUTPUT_ALL:
-        name = 'None'
-    
-    if hasattr(person, 'dob') and person.dob:
-        dob = str(person.dob)
-    elif OUTPUT_ALL:
-        dob = 'None'
-    
-    if hasattr(person, 'age') and person.age:
-        age = str(person.age)
-    elif OUTPUT_ALL:
-        age = 'None'
-    
-    return {'name': name, 'dob': dob, 'age': age}
-
-
-def format_emails(emails: List[str]) -> str:
-    """Format email list."""
-    if not emails:
-        return 'None' if OUTPUT_ALL else 'N/A'
-    
-    return '; '.join(emails)
-
-
-def format_search_metadata(result) -> Dict[str, str]:
-    """Format search metadata with configurable fields."""
-    metadata = {}
-    
-    if hasattr(result, 'email'):
-        metadata['email'] = result.email if result.email else 'N/A'
-    if hasattr(result, 'email_valid'):
-        metadata['email_valid'] = str(result.email_valid)
-    if hasattr(result, 'email_type'):
-        metadata['email_type'] = result.email_type if result.email_type else 'N/A'
-    
-    if hasattr(result, 'total_results'):
-        metadata['total_results'] = str(result.total_results)
-    if hasattr(result, 'search_cost'):
-        metadata['search_cost'] = f"${result.search_cost:.4f}" if result.search_cost else 'N/A'
-    if hasattr(result, 'pricing'):
-        metadata['pricing_breakdown'] = format_pricing_breakdown(result.pricing)
-    if hasattr(result, 'search_timestamp'):
-        metadata['search_timestamp'] = result.search_timestamp.isoformat() if result.search_timestamp else 'N/A'
-    
-    # TLO Enrichment fields
-    if hasattr(result, 'censored_numbers'):
-        metadata['censored_numbers'] = format_censored_numbers(result.censored_numbers)
-    if hasattr(result, 'alternative_names'):
-        metadata['alternative_names'] = format_alternative_names(result.alternative_names)
-    if hasattr(result, 'all_names'):
-        metadata['all_names'] = format_all_names(result.all_names)
-    if hasattr(result, 'all_dobs'):
-        metadata['all_dobs'] = format_all_dobs(result.all_dobs)
-    if hasattr(result, 'related_persons'):
-        metadata['related_persons'] = format_related_persons(result.related_persons)
-    if hasattr(result, 'criminal_records'):
-        metadata['criminal_records'] = format_criminal_records(result.criminal_records)
-    if hasattr(result, 'phone_numbers_full'):
-        metadata['phone_numbers_full'] = format_phone_numbers_full(result.phone_numbers_full)
-    if hasattr(result, 'confirmed_numbers'):
-        metadata['confirmed_numbers'] = '; '.join(result.confirmed_numbers) if result.confirmed_numbers else ('None' if OUTPUT_ALL else 'N/A')
-    if hasattr(result, 'addresses_structured'):
-        metadata['addresses_structured'] = format_addresses_structured(result.addresses_structured)
-    if hasattr(result, 'other_emails'):
-        metadata['other_emails'] = format_emails(result.other_emails) if hasattr(result, 'other_emails') else ('None' if OUTPUT_ALL else 'N/A')
-    
-    return metadata
+    name = getattr(person, 'name', None)
+    dob = getattr(person, 'dob', None)
+    age = getattr(person, 'age', None)
+    
+    return {
+        'name': name if name else _EMPTY_VALUE,
+        'dob': str(dob) if dob else _EMPTY_VALUE,
+        'age': str(age) if age else _EMPTY_VALUE,
+    }
+
+
+# Sentinel telling "attribute absent" apart from an attribute set to None
+_MISSING = object()
+
+
+def _optional_field(attr: str, formatter):
+    """Return a row getter that formats ``attr`` if the result has it, else 'N/A'."""
+    def getter(result, original_email: str) -> str:
+        value = getattr(result, attr, _MISSING)
+        if value is _MISSING:
+            return 'N/A'
+        return formatter(value)
+    return getter
+
+
+def _person_field(key: str):
+    """Return a row getter for one of the format_person() values."""
+    def getter(result, original_email: str) -> str:
+        return format_person(result.person)[key]
+    return getter
+
+
+def _format_result_email(email, original_email: str) -> str:
+    """Format the result's email, falling back to the searched one if absent."""
+    if email is _MISSING:
+        return original_email
+    return email or 'N/A'
+
+
+# How each output field is read from a search result. Every getter takes the
+# result and the email that was searched, and returns the column text.
+_FIELD_GETTERS = {
+    'email': lambda result, original_email: _format_result_email(getattr(result, 'email', _MISSING), original_email),
+    'name': _person_field('name'),
+    'dob': _person_field('dob'),
+    'age': _person_field('age'),
+    'phone_numbers': lambda result, original_email: format_phone_numbers(getattr(result, 'phone_numbers', [])),
+    'addresses': lambda result, original_email: format_addresses(getattr(result, 'addresses', [])),
+    'emails': lambda result, original_email: format_str_list(getattr(result, 'emails', [])),
+    'other_emails': _optional_field('other_emails', format_str_list),
+    'email_valid': _optional_field('email_valid', str),
+    'email_type': _optional_field('email_type', lambda email_type: email_type or 'N/A'),
+    'total_results': _optional_field('total_results', str),
+    'search_cost': _optional_field('search_cost', lambda cost: f"${cost:.4f}" if cost else 'N/A'),
+    'pricing_breakdown': _optional_field('pricing', format_pricing_breakdown),
+    'censored_numbers': _optional_field('censored_numbers', format_str_list),
+    'alternative_names': _optional_field('alternative_names', format_str_list),
+    'all_names': _optional_field('all_names', format_all_names),
+    'all_dobs': _optional_field('all_dobs', format_all_dobs),
+    'related_persons': _optional_field('related_persons', format_related_persons),
+    'criminal_records': _optional_field('criminal_records', format_criminal_records),
+    'phone_numbers_full': _optional_field('phone_numbers_full', format_phone_numbers_full),
+    'confirmed_numbers': _optional_field('confirmed_numbers', format_str_list),
+    'addresses_structured': _optional_field('addresses_structured', format_addresses_structured),
+}
+
+# Getters for the enabled columns, resolved once so formatting a row does no
+# per-field dispatch and never formats a disabled field
+_ROW_GETTERS = tuple(
+    _FIELD_GETTERS.get(field, lambda result, original_email: 'N/A')
+    for field in OUTPUT_FIELD_ORDER
+)
+
+# Row written for an email with no result when OUTPUT_ALL is set
+_EMPTY_LINE = OUTPUT_SEPARATOR.join(['None'] * len(OUTPUT_FIELD_ORDER))
 
 
 def create_output_line(result, original_email: str) -> str:
     """Create a formatted output line based on configured fields."""
     if not result:
         if OUTPUT_ALL:
-            enabled_fields = get_output_field_order()
-            empty_values = ['None'] * len(enabled_fields)
-            return OUTPUT_SEPARATOR.join(empty_values)
+            return _EMPTY_LINE
         return None
     
-    person_info = format_person(result.person)
-    phone_numbers = result.phone_numbers if hasattr(result, 'phone_numbers') else []
-    all_numbers = format_phone_numbers(phone_numbers)
-    addresses = result.addresses if hasattr(result, 'addresses') else []
-    all_addresses = format_addresses(addresses)
-    emails = result.emails if hasattr(result, 'emails') else []
-    all_emails = format_emails(emails)
-    metadata = format_search_metadata(result)
-    
-    enabled_fields = get_output_field_order()
-    output_values = []
-    
-    for field in enabled_fields:
-        if field == 'email':
-            output_values.append(metadata.get('email', original_email))
-        elif field == 'name':
-            output_values.append(person_info['name'])
-        elif field == 'dob':
-            output_values.append(person_info['dob'])
-        elif field == 'age':
-            output_values.append(person_info['age'])
-        elif field == 'phone_numbers':
-            output_values.append(all_numbers)
-        elif field == 'addresses':
-            output_values.append(all_addresses)
-        elif field == 'emails':
-            output_values.append(all_emails)
-        elif field == 'other_emails':
-            output_values.append(metadata.get('other_emails', 'N/A'))
-        elif field == 'email_valid':
-            output_values.append(metadata.get('email_valid', 'N/A'))
-        elif field == 'email_type':
-            output_values.append(metadata.get('email_type', 'N/A'))
-        elif field == 'total_results':
-            output_values.append(metadata.get('total_results', 'N/A'))
-        elif field == 'search_cost':
-            output_values.append(metadata.get('search_cost', 'N/A'))
-        elif field == 'pricing_breakdown':
-            output_values.append(metadata.get('pricing_breakdown', 'N/A'))
-        elif field == 'censored_numbers':
-            output_values.append(metadata.get('censored_numbers', 'N/A'))
-        elif field == 'alternative_names':
-            output_values.append(metadata.get('alternative_names', 'N/A'))
-        elif field == 'all_names':
-            output_values.append(metadata.get('all_names', 'N/A'))
-        elif field == 'all_dobs':
-            output_values.append(metadata.get('all_dobs', 'N/A'))
-        elif field == 'related_persons':
-            output_values.append(metadata.get('related_persons', 'N/A'))
-        elif field == 'criminal_records':
-            output_values.append(metadata.get('criminal_records', 'N/A'))
-        elif field == 'phone_numbers_full':
-            output_values.append(metadata.get('phone_numbers_full', 'N/A'))
-        elif field == 'confirmed_numbers':
-            output_values.append(metadata.get('confirmed_numbers', 'N/A'))
-        elif field == 'addresses_structured':
-            output_values.append(metadata.get('addresses_structured', 'N/A'))
-        else:
-            output_values.append('N/A')
-    
-    return OUTPUT_SEPARATOR.join(output_values)
+    return OUTPUT_SEPARATOR.join([getter(result, original_email) for getter in _ROW_GETTERS])
+
+
+# How handle_api_error reports each client error: log level, log message
+# prefix, and the text written after "ERROR: " in the output row
+_ERROR_HANDLERS = {
+    AuthenticationError: (logging.ERROR, "Authentication failed",
+                          lambda error: "Authentication failed - Invalid API key"),
+    InsufficientBalanceError: (logging.ERROR, "Insufficient balance",
+                               lambda error: f"Insufficient balance - {getattr(error, 'current_balance', 'Unknown')}"),
+    RateLimitError: (logging.WARNING, "Rate limit exceeded",
+                     lambda error: "Rate limit exceeded - Please wait before retrying"),
+    ValidationError: (logging.WARNING, "Validation error",
+                      lambda error: "Invalid email format"),
+    TimeoutError: (logging.WARNING, "Timeout",
+                   lambda error: "Request timeout"),
+    NetworkError: (logging.WARNING, "Network error",
+                   lambda error: "Network connection error"),
+    ServerError: (logging.ERROR, "Server error",
+                  lambda error: f"Server error - {getattr(error, 'status_code', 'Unknown')}"),
+}
+_UNEXPECTED_ERROR = (logging.ERROR, "Unexpected error",
+                     lambda error: f"Unexpected error - {error}")
 
 
 def handle_api_error(error: Exception, email: str) -> str:
     """Handle different types of API errors and return appropriate error message."""
-    if isinstance(error, AuthenticationError):
-        logger.error(f"Authentication failed for {email}: {error}")
-        return f"{email} | ERROR: Authentication failed - Invalid API key"
-    
-    elif isinstance(error, InsufficientBalanceError):
-        logger.error(f"Insufficient balance for {email}: {error}")
-        return f"{email} | ERROR: Insufficient balance - {error.current_balance if hasattr(error, 'current_balance') else 'Unknown'}"
-    
-    elif isinstance(error, RateLimitError):
-        logger.warning(f"Rate limit exceeded for {email}: {error}")
-        return f"{email} | ERROR: Rate limit exceeded - Please wait before retrying"
-    
-    elif isinstance(error, ValidationError):
-        logger.warning(f"Validation error for {email}: {error}")
-        return f"{email} | ERROR: Invalid email format"
-    
-    elif isinstance(error, TimeoutError):
-        logger.warning(f"Timeout for {email}: {error}")
-        return f"{email} | ERROR: Request timeout"
-    
-    elif isinstance(error, NetworkError):
-        logger.warning(f"Network error for {email}: {error}")
-        return f"{email} | ERROR: Network connection error"
-    
-    elif isinstance(error, ServerError):
-        logger.error(f"Server error for {email}: {error}")
-        return f"{email} | ERROR: Server error - {error.status_code if hasattr(error, 'status_code') else 'Unknown'}"
-    
-    else:
-        logger.error(f"Unexpected error for {email}: {error}")
-        return f"{email} | ERROR: Unexpected error - {str(error)}"
-
-
-def optimize_existing_session(session: 'Session') -> 'Session':
-    """Optimize an existing session with better connection pool settings."""
-    from requests.adapters import HTTPAdapter
-    from urllib3.util import Retry
-    
-    adapter = HTTPAdapter(
-        pool_connections=10,
-        pool_maxsize=CONNECTION_POOL_MAXSIZE,
-        pool_block=False,
-        max_retries=Retry(
-            total=1,
-            status_forcelist=[500, 502, 503, 504],
-            backoff_factor=0.1
+    handler = _ERROR_HANDLERS.get(type(error))
+    if handler is None:
+        # Subclasses of the client errors resolve through their MRO
+        handler = next(
+            (_ERROR_HANDLERS[cls] for cls in type(error).__mro__ if cls in _ERROR_HANDLERS),
+            _UNEXPECTED_ERROR,
         )
-    )
-    
-    session.mount('http://', adapter)
-    session.mount('https://', adapter)
-    
-    session.timeout = 15
-    
-    return session
-
-
-def fetch_email_info(email: str, output_file: str, api_client: SearchAPI) -> None:
-    """Fetch email information with comprehensive error handling and retries."""
+    level, label, describe = handler
+    logger.log(level, "%s for %s: %s", label, email, error)
+    return f"{email} | ERROR: {describe(error)}"
+
+
+def retry_delay(attempt: int, error: Optional[Exception] = None,
+                base: float = RETRY_DELAY_BASE) -> float:
+    """Seconds to wait before the next attempt.
+
+    A server-supplied Retry-After on a RateLimitError wins; otherwise use
+    jittered exponential backoff so workers that failed together do not
+    retry in lockstep. Either way the wait is capped at RETRY_DELAY_CAP.
+    """
+    retry_after = getattr(error, 'retry_after', None)
+    if retry_after is not None:
+        return min(retry_after, RETRY_DELAY_CAP)
+    return random.uniform(base, min(RETRY_DELAY_CAP, base * 3 * 2 ** attempt))
+
+
+def count_result_data(result) -> Dict[str, int]:
+    """Count the items in each populated DATA_FIELDS entry of a result.
+
+    Walks the result once; fields that are missing or empty are left out.
+    A person counts as one item when it has a name.
+    """
+    counts = {}
+    for name in DATA_FIELDS:
+        value = getattr(result, name, None)
+        if name == 'person':
+            if value and value.name:
+                counts[name] = 1
+        elif value:
+            counts[name] = len(value)
+    return counts
+
+
+def log_found_data(email: str, result, counts: Dict[str, int]) -> None:
+    """Log the per-email summary line for a result that will be written."""
+    data_fields = [
+        "person" if name == 'person' else f"{counts[name]} {DATA_FIELD_LABELS[name]}"
+        for name in counts if name in DATA_FIELD_LABELS
+    ]
+    actual_total = sum(counts.values())
+    
+    # Result and pricing fields are declared on their dataclasses, so read them directly
+    pricing = result.pricing
+    search_cost = result.search_cost
+    total_cost = pricing.total_cost if pricing else None
+    
+    search_cost_str = "N/A"
+    if pricing:
+        base_cost = pricing.search_cost
+        if total_cost is not None:
+            search_cost_str = f"${total_cost:.4f}"
+        elif base_cost is not None:
+            search_cost_str = f"${base_cost:.4f}"
+    elif search_cost is not None:
+        search_cost_str = f"${search_cost:.4f}"
+    
+    if pricing and total_cost is not None and total_cost != search_cost:
+        logger.debug("Pricing mismatch for %s: pricing.total_cost=%s, result.search_cost=%s",
+                     email, total_cost, search_cost)
+    
+    logger.info("Found data for: %s - %s (total_items=%s, search_cost=%s)",
+                email, ', '.join(data_fields), actual_total, search_cost_str)
+
+
+def fetch_email_info(email: str, api_client: SearchAPI) -> Optional[str]:
+    """
+    Fetch email information with comprehensive error handling and retries.
+    
+    Returns the output line for the email, or None if nothing should be
+    written. Lines are written by main() as searches complete, through a
+    single buffered file handle.
+    """
     for attempt in range(MAX_RETRIES):
         try:
-            logger.debug(f"Searching for email: {email} (attempt {attempt + 1})")
+            logger.debug("Searching for email: %s (attempt %d)", email, attempt + 1)
             
             result = api_client.search_email(
                 email=email,
@@ -669,224 +702,128 @@ def fetch_email_info(email: str, output_file: str, api_client: SearchAPI) -> Non
             
             if not result:
                 if OUTPUT_ALL:
-                    result_line = create_output_line(None, email)
-                    with open(output_file, 'a', encoding=OUTPUT_ENCODING) as f:
-                        f.write(result_line + '\n')
-                    logger.debug(f"No result object for: {email}")
-                return
-            
-            has_any_data = False
-            
-            if (hasattr(result, 'phone_numbers') and result.phone_numbers) or \
-               (hasattr(result, 'addresses') and result.addresses) or \
-               (hasattr(result, 'person') and result.person and result.person.name) or \
-               (hasattr(result, 'emails') and result.emails):
-                has_any_data = True
-            
-            if TLO_ENRICHMENT and not has_any_data:
-                if (hasattr(result, 'phone_numbers_full') and result.phone_numbers_full) or \
-                   (hasattr(result, 'addresses_structured') and result.addresses_structured) or \
-                   (hasattr(result, 'all_names') and result.all_names) or \
-                   (hasattr(result, 'alternative_names') and result.alternative_names) or \
-                   (hasattr(result, 'all_dobs') and result.all_dobs) or \
-                   (hasattr(result, 'related_persons') and result.related_persons) or \
-                   (hasattr(result, 'criminal_records') and result.criminal_records) or \
-                   (hasattr(result, 'censored_numbers') and result.censored_numbers) or \
-                   (hasattr(result, 'confirmed_numbers') and result.confirmed_numbers) or \
-                   (hasattr(result, 'other_emails') and result.other_emails):
-                    has_any_data = True
+                    logger.debug("No result object for: %s", email)
+                    return create_output_line(None, email)
+                return None
             
-            if not has_any_data and hasattr(result, 'total_results') and result.total_results > 0:
-                has_any_data = True
+            counts = count_result_data(result)
             
-            if not has_any_data and not OUTPUT_ALL:
-                logger.debug(f"No data found for: {email} (total_results={result.total_results if hasattr(result, 'total_results') else 'N/A'})")
-                return
+            if not counts and not OUTPUT_ALL and not result.total_results > 0:
+                logger.debug("No data found for: %s (total_results=%s)", email, result.total_results)
+                return None
             
             result_line = create_output_line(result, email)
             
-            has_data = False
-            if OUTPUT_ALL:
-                has_data = True
-            else:
-                if hasattr(result, 'phone_numbers') and result.phone_numbers:
-                    has_data = True
-                if hasattr(result, 'addresses') and result.addresses:
-                    has_data = True
-                if hasattr(result, 'person') and result.person and result.person.name:
-                    has_data = True
-                if hasattr(result, 'emails') and result.emails:
-                    has_data = True
-                
-                if TLO_ENRICHMENT:
-                    if hasattr(result, 'phone_numbers_full') and result.phone_numbers_full:
-                        has_data = True
-                    if hasattr(result, 'addresses_structured') and result.addresses_structured:
-                        has_data = True
-                    if hasattr(result, 'all_names') and result.all_names:
-                        has_data = True
-                    if hasattr(result, 'alternative_names') and result.alternative_names:
-                        has_data = True
-                    if hasattr(result, 'all_dobs') and result.all_dobs:
-                        has_data = True
-                    if hasattr(result, 'related_persons') and result.related_persons:
-                        has_data = True
-                    if hasattr(result, 'criminal_records') and result.criminal_records:
-                        has_data = True
-                    if hasattr(result, 'censored_numbers') and result.censored_numbers:
-                        has_data = True
-                    if hasattr(result, 'confirmed_numbers') and result.confirmed_numbers:
-                        has_data = True
-                    if hasattr(result, 'other_emails') and result.other_emails:
-                        has_data = True
+            has_data = OUTPUT_ALL or bool(counts)
             
             if result_line and has_data:
-                with open(output_file, 'a', encoding=OUTPUT_ENCODING) as f:
-                    f.write(result_line + '\n')
-                
-                data_fields = []
-                if hasattr(result, 'phone_numbers') and result.phone_numbers:
-                    data_fields.append(f"{len(result.phone_numbers)} phones")
-                if hasattr(result, 'addresses') and result.addresses:
-                    data_fields.append(f"{len(result.addresses)} addresses")
-                if hasattr(result, 'person') and result.person and result.person.name:
-                    data_fields.append("person")
+                if logger.isEnabledFor(logging.INFO):
+                    log_found_data(email, result, counts)
+            elif logger.isEnabledFor(logging.DEBUG):
+                debug_info = [
+                    f"total_results={result.total_results}",
+                    f"phone_numbers={counts.get('phone_numbers', 0)}",
+                    f"addresses={counts.get('addresses', 0)}",
+                ]
                 if TLO_ENRICHMENT:
-                    if hasattr(result, 'phone_numbers_full') and result.phone_numbers_full:
-                        data_fields.append(f"{len(result.phone_numbers_full)} TLO phones")
-                    if hasattr(result, 'addresses_structured') and result.addresses_structured:
-                        data_fields.append(f"{len(result.addresses_structured)} TLO addresses")
-                    if hasattr(result, 'all_names') and result.all_names:
-                        data_fields.append(f"{len(result.all_names)} name records")
+                    debug_info.append(f"phone_numbers_full={counts.get('phone_numbers_full', 0)}")
+                    debug_info.append(f"addresses_structured={counts.get('addresses_structured', 0)}")
+                    debug_info.append(f"all_names={counts.get('all_names', 0)}")
                 
-                actual_total = 0
-                if hasattr(result, 'phone_numbers') and result.phone_numbers:
-                    actual_total += len(result.phone_numbers)
-                if hasattr(result, 'addresses') and result.addresses:
-                    actual_total += len(result.addresses)
-                if hasattr(result, 'person') and result.person and result.person.name:
-                    actual_total += 1
-                if hasattr(result, 'emails') and result.emails:
-                    actual_total += len(result.emails)
-                if TLO_ENRICHMENT:
-                    if hasattr(result, 'phone_numbers_full') and result.phone_numbers_full:
-                        actual_total += len(result.phone_numbers_full)
-                    if hasattr(result, 'addresses_structured') and result.addresses_structured:
-                        actual_total += len(result.addresses_structured)
-                    if hasattr(result, 'all_names') and result.all_names:
-                        actual_total += len(result.all_names)
-                    if hasattr(result, 'alternative_names') and result.alternative_names:
-                        actual_total += len(result.alternative_names)
-                    if hasattr(result, 'all_dobs') and result.all_dobs:
-                        actual_total += len(result.all_dobs)
-                    if hasattr(result, 'related_persons') and result.related_persons:
-                        actual_total += len(result.related_persons)
-                    if hasattr(result, 'criminal_records') and result.criminal_records:
-                        actual_total += len(result.criminal_records)
-                    if hasattr(result, 'censored_numbers') and result.censored_numbers:
-                        actual_total += len(result.censored_numbers)
-                    if hasattr(result, 'confirmed_numbers') and result.confirmed_numbers:
-                        actual_total += len(result.confirmed_numbers)
-                    if hasattr(result, 'other_emails') and result.other_emails:
-                        actual_total += len(result.other_emails)
-                
-                search_cost_str = "N/A"
-                if hasattr(result, 'pricing') and result.pricing:
-                    if hasattr(result.pricing, 'total_cost') and result.pricing.total_cost is not None:
-                        search_cost_str = f"${result.pricing.total_cost:.4f}"
-                    elif hasattr(result.pricing, 'search_cost') and result.pricing.search_cost is not None:
-                        search_cost_str = f"${result.pricing.search_cost:.4f}"
-                elif hasattr(result, 'search_cost') and result.search_cost is not None:
-                    search_cost_str = f"${result.search_cost:.4f}"
-                
-                if hasattr(result, 'pricing') and result.pricing and hasattr(result, 'search_cost'):
-                    if hasattr(result.pricing, 'total_cost') and result.pricing.total_cost != result.search_cost:
-                        logger.debug(f"Pricing mismatch for {email}: pricing.total_cost={result.pricing.total_cost}, result.search_cost={result.search_cost}")
-                
-                logger.info(f"Found data for: {email} - {', '.join(data_fields)} (total_items={actual_total}, search_cost={search_cost_str})")
-            else:
-                debug_info = []
-                if hasattr(result, 'total_results'):
-                    debug_info.append(f"total_results={result.total_results}")
-                if hasattr(result, 'phone_numbers'):
-                    debug_info.append(f"phone_numbers={len(result.phone_numbers) if result.phone_numbers else 0}")
-                if hasattr(result, 'addresses'):
-                    debug_info.append(f"addresses={len(result.addresses) if result.addresses else 0}")
-                if TLO_ENRICHMENT:
-                    if hasattr(result, 'phone_numbers_full'):
-                        debug_info.append(f"phone_numbers_full={len(result.phone_numbers_full) if result.phone_numbers_full else 0}")
-                    if hasattr(result, 'addresses_structured'):
-                        debug_info.append(f"addresses_structured={len(result.addresses_structured) if result.addresses_structured else 0}")
-                    if hasattr(result, 'all_names'):
-                        debug_info.append(f"all_names={len(result.all_names) if result.all_names else 0}")
-                
-                logger.debug(f"No significant data for: {email} ({', '.join(debug_info)})")
+                logger.debug("No significant data for: %s (%s)", email, ', '.join(debug_info))
             
-            return
+            return result_line if result_line and has_data else None
 
         except SearchAPIError as e:
             error_str = str(e)
             
             if "No data found" in error_str:
                 if OUTPUT_ALL:
-                    result_line = create_output_line(None, email)
-                    with open(output_file, 'a', encoding=OUTPUT_ENCODING) as f:
-                        f.write(result_line + '\n')
-                    logger.debug(f"No data found for: {email}")
-                return
+                    logger.debug("No data found for: %s", email)
+                    return create_output_line(None, email)
+                return None
             
             if "403" in error_str or "Request failed: 403" in error_str:
-                logger.warning(f"Rate limited (403) for {email}: {error_str}")
+                logger.warning("Rate limited (403) for %s: %s", email, error_str)
                 if attempt == MAX_RETRIES - 1:
-                    error_line = f"{email} | ERROR: Rate limited (403) - Too many requests"
-                    with open(output_file, 'a', encoding=OUTPUT_ENCODING) as f:
-                        f.write(error_line + '\n')
-                    return
+                    return f"{email} | ERROR: Rate limited (403) - Too many requests"
                 else:
-                    import time
-                    delay = (RETRY_DELAY_BASE ** attempt) * 5
-                    logger.warning(f"Waiting {delay} seconds before retry for {email}")
+                    delay = retry_delay(attempt, base=RETRY_DELAY_BASE * 5)
+                    logger.warning("Waiting %.1f seconds before retry for %s", delay, email)
                     time.sleep(delay)
                     continue
             
             if isinstance(e, (AuthenticationError, InsufficientBalanceError, ValidationError)):
-                error_line = handle_api_error(e, email)
-                with open(output_file, 'a', encoding=OUTPUT_ENCODING) as f:
-                    f.write(error_line + '\n')
-                return
+                return handle_api_error(e, email)
             
             elif isinstance(e, (RateLimitError, TimeoutError, NetworkError, ServerError)):
                 if attempt == MAX_RETRIES - 1:
-                    error_line = handle_api_error(e, email)
-                    with open(output_file, 'a', encoding=OUTPUT_ENCODING) as f:
-                        f.write(error_line + '\n')
-                    return
+                    return handle_api_error(e, email)
                 else:
-                    import time
-                    delay = RETRY_DELAY_BASE ** attempt
-                    logger.warning(f"Retrying {email} in {delay} seconds (attempt {attempt + 1}/{MAX_RETRIES})")
+                    delay = retry_delay(attempt, e)
+                    logger.warning("Retrying %s in %.1f seconds (attempt %d/%d)", email, delay, attempt + 1, MAX_RETRIES)
                     time.sleep(delay)
             else:
-                logger.error(f"Search API error for {email}: {error_str}")
+                logger.error("Search API error for %s: %s", email, error_str)
                 if attempt == MAX_RETRIES - 1:
-                    error_line = f"{email} | ERROR: Search API error - {error_str}"
-                    with open(output_file, 'a', encoding=OUTPUT_ENCODING) as f:
-                        f.write(error_line + '\n')
+                    return f"{email} | ERROR: Search API error - {error_str}"
                 else:
-                    import time
-                    delay = RETRY_DELAY_BASE ** attempt
-                    time.sleep(delay)
+                    time.sleep(retry_delay(attempt))
         
         except Exception as e:
-            logger.error(f"Unexpected error for {email}: {str(e)}")
+            logger.error("Unexpected error for %s: %s", email, e)
             if attempt == MAX_RETRIES - 1:
-                error_line = f"{email} | ERROR: Unexpected error - {str(e)}"
-                with open(output_file, 'a', encoding=OUTPUT_ENCODING) as f:
-                    f.write(error_line + '\n')
+                return f"{email} | ERROR: Unexpected error - {str(e)}"
             else:
-                import time
-                delay = RETRY_DELAY_BASE ** attempt
-                time.sleep(delay)
+                time.sleep(retry_delay(attempt))
+
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the shared worker pool, starting it on first use.
+
+    Repeated main() calls in one process reuse the same threads instead
+    of spinning up and joining MAX_WORKERS of them each time.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='search')
+        atexit.register(_EXECUTOR.shutdown)
+    return _EXECUTOR
+
+
+def warm_connections(api_client: SearchAPI, executor: ThreadPoolExecutor) -> None:
+    """Open one pooled connection per worker with concurrent HEAD requests.
+
+    The pings go to the API's origin, not the search endpoint, and pass
+    through the client's throttle like any other request. Each worker
+    keeps its response open until all of them have connected, so no two
+    share a connection, and the first wave of searches then skips the
+    TCP and TLS handshakes. Failures are ignored; the searches simply
+    connect on their own.
+    """
+    session = api_client.session
+    scheme, netloc = urlsplit(api_client.config.base_url)[:2]
+    url = urlunsplit((scheme, netloc, '/', '', ''))
+    timeout = api_client.config.timeout
+    barrier = threading.Barrier(MAX_WORKERS)
+    
+    def head(_):
+        response = None
+        try:
+            api_client._throttle()
+            response = session.head(url, timeout=timeout, stream=True)
+            barrier.wait(timeout)
+        except Exception:
+            # Let the other workers go rather than waiting out the timeout
+            barrier.abort()
+        finally:
+            if response is not None:
+                response.close()
+    
+    list(executor.map(head, range(MAX_WORKERS)))
 
 
 def main(emails: List[str], output_file: str) -> None:
@@ -895,62 +832,84 @@ def main(emails: List[str], output_file: str) -> None:
         logger.error("API key is required. Please set the api_key variable.")
         return
     
+    # Searches submitted to the shared pool and not yet collected
+    future_to_email = {}
+    
     try:
-        config = SearchAPIConfig(api_key=api_key, debug_mode=False)
+        config = SearchAPIConfig(
+            api_key=api_key,
+            debug_mode=False,
+            pool_maxsize=CONNECTION_POOL_MAXSIZE,
+        )
         api_client = SearchAPI(config=config)
         
-        api_client.session = optimize_existing_session(api_client.session)
-        
         try:
             balance_info = api_client.get_balance()
-            logger.info(f"Current balance: ${balance_info.current_balance}")
+            logger.info("Current balance: $%s", balance_info.current_balance)
             
-            base_cost = 0.0025
-            feature_costs = 0.0
-            if HOUSE_VALUE:
-                feature_costs += 0.0015
-            if EXTRA_INFO:
-                feature_costs += 0.0015
-            if CARRIER_INFO:
-                feature_costs += 0.0005
-            if TLO_ENRICHMENT:
-                feature_costs += 0.0030
-            
-            estimated_cost = len(emails) * (base_cost + feature_costs)
+            estimated_cost = len(emails) * estimate_search_cost(
+                house_value=HOUSE_VALUE,
+                extra_info=EXTRA_INFO,
+                carrier_info=CARRIER_INFO,
+                tlo_enrichment=TLO_ENRICHMENT,
+            )
             if balance_info.current_balance < estimated_cost:
-                logger.warning(f"Insufficient balance for all searches. Current: ${balance_info.current_balance}, Estimated needed: ${estimated_cost}")
+                logger.warning("Insufficient balance for all searches. Current: $%s, Estimated needed: $%s",
+                               balance_info.current_balance, estimated_cost)
         except Exception as e:
-            logger.warning(f"Could not check balance: {e}")
-        
-        logger.info(f"Starting to process {len(emails)} emails with {MAX_WORKERS} workers")
-        logger.info(f"Output fields: {', '.join(get_output_field_order())}")
-        logger.info(f"Connection pool: max {CONNECTION_POOL_MAXSIZE} connections per host (auto-scaled from {MAX_WORKERS} workers)")
-        
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            future_to_email = {
-                executor.submit(fetch_email_info, email, output_file, api_client): email 
-                for email in emails
-            }
+            logger.warning("Could not check balance: %s", e)
+        
+        logger.info("Starting to process %d emails with %d workers", len(emails), MAX_WORKERS)
+        logger.info("Output fields: %s", ', '.join(get_output_field_order()))
+        logger.info("Connection pool: max %d connections per host (auto-scaled from %d workers)",
+                    CONNECTION_POOL_MAXSIZE, MAX_WORKERS)
+        
+        executor = get_executor()
+        if PREWARM_CONNECTIONS:
+            warm_connections(api_client, executor)
+        with open(output_file, 'ab', buffering=OUTPUT_BUFFER_SIZE) as out_f:
+            # Keep at most MAX_IN_FLIGHT searches submitted at a time and top
+            # the window up as they finish, rather than creating a future
+            # for every email up front
+            pending_emails = iter(emails)
+            
+            def submit_more():
+                for email in pending_emails:
+                    future_to_email[executor.submit(fetch_email_info, email, api_client)] = email
+                    if len(future_to_email) >= MAX_IN_FLIGHT:
+                        return
             
+            submit_more()
             completed = 0
-            for future in as_completed(future_to_email):
-                email = future_to_email[future]
-                completed += 1
-                
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Task failed for {email}: {e}")
-                
-                if completed % 25 == 0 or completed == len(emails):
-                    logger.info(f"Progress: {completed}/{len(emails)} emails processed")
+            while future_to_email:
+                done, _ = wait(future_to_email, return_when=FIRST_COMPLETED)
+                for future in done:
+                    email = future_to_email.pop(future)
+                    completed += 1
+                    
+                    try:
+                        line = future.result()
+                    except Exception as e:
+                        logger.error("Task failed for %s: %s", email, e)
+                    else:
+                        if line:
+                            out_f.write((line + '\n').encode(OUTPUT_ENCODING))
+                    
+                    if completed % 25 == 0 or completed == len(emails):
+                        logger.info("Progress: %d/%d emails processed", completed, len(emails))
+                submit_more()
         
         logger.info("Processing complete!")
         
     except Exception as e:
-        logger.error(f"Fatal error in main: {str(e)}")
+        logger.error("Fatal error in main: %s", e)
         traceback.print_exc()
     finally:
+        # The pool outlives this call, so drop queued searches and wait
+        # for running ones before their session is closed
+        for future in future_to_email:
+            future.cancel()
+        wait(future_to_email)
         try:
             api_client.close()
         except:
@@ -962,11 +921,11 @@ if __name__ == '__main__':
     
     if INCLUDE_HEADER:
         header = create_header()
-        with open(output_file, 'w', encoding=OUTPUT_ENCODING) as f:
+        with open(output_file, 'wb') as f:
             if header:
-                f.write(header + '\n')
+                f.write((header + '\n').encode(OUTPUT_ENCODING))
     else:
-        open(output_file, 'w', encoding=OUTPUT_ENCODING).close()
+        open(output_file, 'wb').close()
     
     try:
         emails = load_emails('emails.txt')
@@ -974,16 +933,17 @@ if __name__ == '__main__':
             logger.error("No valid emails found in emails.txt")
             exit(1)
         
-        logger.info(f"Starting email search with {len(emails)} emails")
-        logger.info(f"Configuration: OUTPUT_ALL={OUTPUT_ALL}, HOUSE_VALUE={HOUSE_VALUE}, EXTRA_INFO={EXTRA_INFO}, CARRIER_INFO={CARRIER_INFO}, TLO_ENRICHMENT={TLO_ENRICHMENT}")
-        logger.info(f"Output format: {OUTPUT_SEPARATOR.join(get_output_field_order())}")
+        logger.info("Starting email search with %d emails", len(emails))
+        logger.info("Configuration: OUTPUT_ALL=%s, HOUSE_VALUE=%s, EXTRA_INFO=%s, CARRIER_INFO=%s, TLO_ENRICHMENT=%s",
+                    OUTPUT_ALL, HOUSE_VALUE, EXTRA_INFO, CARRIER_INFO, TLO_ENRICHMENT)
+        logger.info("Output format: %s", OUTPUT_SEPARATOR.join(get_output_field_order()))
         
         main(emails, output_file)
         
-        logger.info(f"Processing complete. Results saved to {output_file}")
+        logger.info("Processing complete. Results saved to %s", output_file)
         
     except FileNotFoundError:
         logger.error("Error: emails.txt file not found. Please create a file with one email per line.")
     except Exception as e:
-        logger.error(f"Error: {str(e)}")
+        logger.error("Error: %s", e)
         traceback.print_exc()
@@ -1,4 +1,5 @@
 from .client import SearchAPI
+from .aio import AsyncSearchAPI
 from .exceptions import (
     SearchAPIError,
     AuthenticationError,
@@ -23,12 +24,22 @@ from .models import (
     PhoneFormat,
     SearchType,
     PricingInfo,
+    BatchSearchResult,
+    PRICING,
+    BASE_SEARCH_COST,
+    HOUSE_VALUE_COST,
+    EXTRA_INFO_COST,
+    CARRIER_INFO_COST,
+    TLO_ENRICHMENT_COST,
+    MAX_SEARCH_COST,
+    estimate_search_cost,
 )
 
 __version__ = "2.0.0"
 
 __all__ = [
     "SearchAPI",
+    "AsyncSearchAPI",
     "SearchAPIError",
     "AuthenticationError",
     "ValidationError",
@@ -50,4 +61,13 @@ __all__ = [
     "PhoneFormat",
     "SearchType",
     "PricingInfo",
+    "BatchSearchResult",
+    "PRICING",
+    "BASE_SEARCH_COST",
+    "HOUSE_VALUE_COST",
+    "EXTRA_INFO_COST",
+    "CARRIER_INFO_COST",
+    "TLO_ENRICHMENT_COST",
+    "MAX_SEARCH_COST",
+    "estimate_search_cost",
 ] 
\ No newline at end of file
@@ -0,0 +1,100 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
+
+from .client import MAX_BATCH_WORKERS, SearchAPI
+from .models import (
+    AccessLog,
+    BalanceInfo,
+    DomainSearchResult,
+    EmailSearchResult,
+    PhoneSearchResult,
+    SearchAPIConfig,
+)
+
+
+class AsyncSearchAPI:
+    """
+    asyncio front end for :class:`SearchAPI`.
+
+    Each call runs the blocking client on a bounded thread pool. The pooled
+    session, retries, rate limiting and cache are shared with the wrapped
+    client, so independent searches can be awaited together with
+    ``asyncio.gather`` without a second HTTP stack.
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        config: SearchAPIConfig = None,
+        max_workers: int = MAX_BATCH_WORKERS,
+        client: Optional[SearchAPI] = None,
+    ):
+        """
+        Initialize the async client.
+
+        Args:
+            api_key: Your API key
+            config: Configuration object (optional)
+            max_workers: Maximum number of requests in flight at once
+            client: Existing client to wrap instead of building one from
+                ``api_key``/``config``; it is left open by :meth:`close`
+        """
+        self._owns_client = client is None
+        self.client = SearchAPI(api_key=api_key, config=config) if client is None else client
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="search_api"
+        )
+
+    async def _run(self, func, *args, **kwargs) -> Any:
+        """Run a blocking client method on the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def get_balance(self, refresh: bool = False) -> BalanceInfo:
+        """Async version of :meth:`SearchAPI.get_balance`."""
+        return await self._run(self.client.get_balance, refresh=refresh)
+
+    async def get_access_logs(self) -> List[AccessLog]:
+        """Async version of :meth:`SearchAPI.get_access_logs`."""
+        return await self._run(self.client.get_access_logs)
+
+    async def search_email(self, email: str, **kwargs) -> EmailSearchResult:
+        """Async version of :meth:`SearchAPI.search_email`."""
+        return await self._run(self.client.search_email, email, **kwargs)
+
+    async def search_phone(self, phone: str, **kwargs) -> List[PhoneSearchResult]:
+        """Async version of :meth:`SearchAPI.search_phone`."""
+        return await self._run(self.client.search_phone, phone, **kwargs)
+
+    async def search_domain(self, domain: str, **kwargs) -> DomainSearchResult:
+        """Async version of :meth:`SearchAPI.search_domain`."""
+        return await self._run(self.client.search_domain, domain, **kwargs)
+
+    def clear_cache(self) -> None:
+        """Remove all cached search results."""
+        self.client.clear_cache()
+
+    async def close(self) -> None:
+        """Wait for running calls to finish, then close the client if this wrapper created it."""
+        await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self._executor.shutdown, wait=True)
+        )
+        if self._owns_client:
+            self.client.close()
+
+    async def __aenter__(self) -> "AsyncSearchAPI":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[Any],
+    ) -> None:
+        """Async context manager exit."""
+        await self.close()
@@ -0,0 +1,96 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """
+    Thread-safe in-memory cache for search results.
+
+    Entries expire ``ttl`` seconds after they are stored. When the cache is
+    full, expired entries are dropped first and then the least recently used
+    entries are evicted.
+
+    Every entry shares the same TTL, so storage order is also expiry order.
+    A second index kept in that order lets expired entries be dropped from
+    its front without scanning the whole cache.
+    """
+
+    def __init__(self, max_size: int = 500, ttl: float = 1800):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries to keep
+            ttl: Time-to-live of each entry in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        # Keys by time of storage, oldest (earliest to expire) first
+        self._expiry: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for ``key``, or None if missing or expired.
+
+        Hits don't take the lock: the lookup and the LRU bump are each a
+        single OrderedDict call, which the GIL makes atomic. Only dropping
+        an expired entry is done under the lock.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            with self._lock:
+                # Another thread may have replaced or evicted it meanwhile
+                if self._data.get(key) is entry:
+                    del self._data[key]
+                    del self._expiry[key]
+            return None
+
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            # Evicted by a concurrent set(); the value read is still valid
+            pass
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting old entries if needed."""
+        with self._lock:
+            expires_at = time.monotonic() + self.ttl
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            self._expiry[key] = expires_at
+            self._expiry.move_to_end(key)
+
+            if len(self._data) > self.max_size:
+                self._purge_expired()
+            while len(self._data) > self.max_size:
+                key, _ = self._data.popitem(last=False)
+                del self._expiry[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+            self._expiry.clear()
+
+    def _purge_expired(self) -> None:
+        """Drop every expired entry. Caller must hold the lock."""
+        now = time.monotonic()
+        expiry = self._expiry
+        while expiry:
+            key, expires_at = next(iter(expiry.items()))
+            if expires_at > now:
+                break
+            del expiry[key]
+            del self._data[key]
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -2,10 +2,15 @@ import json
 import re
 import gzip
 import logging
+import threading
+import time
 import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import fields, replace
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Dict, List, Optional, Union, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Union, Any
 from urllib.parse import urlencode, quote_plus
 
 import phonenumbers
@@ -22,6 +27,16 @@ try:
 except ImportError:
     BROTLI_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if TYPE_CHECKING:
+    import pandas
+
+from .cache import ResponseCache
 from .exceptions import (
     AuthenticationError,
     InsufficientBalanceError,
@@ -45,6 +60,7 @@ from .models import (
     PhoneFormat,
     SearchType,
     AccessLog,
+    BatchSearchResult,
     StructuredAddress,
     StructuredAddressComponents,
     NameRecord,
@@ -54,34 +70,120 @@ from .models import (
     Crime,
     PhoneNumberFull,
     PricingInfo,
+    BASE_SEARCH_COST,
 )
+from .ratelimit import RateLimiter, TokenBucket, parse_retry_after
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# Maximum number of concurrent searches run by the batch helpers
+MAX_BATCH_WORKERS = 8
+
+# Retries per query when a batch search is rate limited
+MAX_BATCH_RETRIES = 2
+
+# Responses and methods retried by the session's urllib3 retry policy.
+# 429 is left to the RateLimitError path, which caps its wait at
+# rate_limit_max_wait; urllib3 would sleep for any Retry-After uncapped,
+# so the policy also backs off on its own schedule rather than the header.
+_RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})
+_RETRY_METHODS = frozenset({"GET", "POST"})
+
 # Compiled regex patterns for performance optimization
-_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Patterns are used with fullmatch(); unlike ``$``, that never lets a trailing newline through
+_EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# Fast path for well-formed ASCII domains: dot-separated labels that don't
+# start or end with a hyphen, and a top-level label of 2+ characters
+_DOMAIN_PATTERN = re.compile(
+    r'(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9][a-z0-9-]*[a-z0-9]'
+)
+
+# AccessLog fields, in order, used as the columns of get_access_logs_df()
+_ACCESS_LOG_COLUMNS = tuple(f.name for f in fields(AccessLog))
 
 # Translation table for phone number cleaning (removes spaces, dashes, parentheses, dots)
 _PHONE_CLEAN_TABLE = str.maketrans('', '', ' -().')
 
-# Compiled regex patterns for address formatting
-_STREET_TYPE_PATTERNS = {
-    abbrev: re.compile(rf'\b{re.escape(abbrev)}\b', re.IGNORECASE)
-    for abbrev in ["st", "ave", "blvd", "rd", "ln", "dr", "ct", "ter", "pl", "way", 
-                   "pkwy", "cir", "sq", "hwy", "bend", "cove"]
+# Street-type and state abbreviations rewritten by _format_address. One
+# alternation matches any of them as a whole word, so each address is
+# scanned once rather than once per abbreviation.
+_STREET_TYPE_ABBREVS = (
+    "st", "ave", "blvd", "rd", "ln", "dr", "ct", "ter", "pl", "way",
+    "pkwy", "cir", "sq", "hwy", "bend", "cove",
+)
+_STATE_ABBREVS = (
+    "al", "ak", "az", "ar", "ca", "co", "ct", "de", "fl", "ga",
+    "hi", "id", "il", "in", "ia", "ks", "ky", "la", "me", "md",
+    "ma", "mi", "mn", "ms", "mo", "mt", "ne", "nv", "nh", "nj",
+    "nm", "ny", "nc", "nd", "oh", "ok", "or", "pa", "ri", "sc",
+    "sd", "tn", "tx", "ut", "vt", "va", "wa", "wv", "wi", "wy",
+)
+_ADDRESS_ABBREV_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, _STREET_TYPE_ABBREVS + _STATE_ABBREVS)) + r')\b',
+    re.IGNORECASE,
+)
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a timestamp, trying the fast ISO-8601 parser before dateutil."""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return parse(value)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a JSON number or numeric string to Decimal, keeping the value as written."""
+    # Ints convert exactly without the string round trip; floats still go
+    # through str() so 250000.1 doesn't become its binary expansion
+    if type(value) is int:
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+# phonenumbers output styles for each PhoneFormat
+_PHONE_NUMBER_FORMATS = {
+    PhoneFormat.INTERNATIONAL.value: phonenumbers.PhoneNumberFormat.INTERNATIONAL,
+    PhoneFormat.NATIONAL.value: phonenumbers.PhoneNumberFormat.NATIONAL,
+    PhoneFormat.E164.value: phonenumbers.PhoneNumberFormat.E164,
 }
+_E164 = PhoneFormat.E164.value
 
-_STATE_ABBREV_PATTERNS = {
-    abbrev: re.compile(rf'\b{re.escape(abbrev)}\b', re.IGNORECASE)
-    for abbrev in ["al", "ak", "az", "ar", "ca", "co", "ct", "de", "fl", "ga",
-                   "hi", "id", "il", "in", "ia", "ks", "ky", "la", "me", "md",
-                   "ma", "mi", "mn", "ms", "mo", "mt", "ne", "nv", "nh", "nj",
-                   "nm", "ny", "nc", "nd", "oh", "ok", "or", "pa", "ri", "sc",
-                   "sd", "tn", "tx", "ut", "vt", "va", "wa", "wv", "wi", "wy"]
+# Layouts phonenumbers produces for a NANP number with a valid area code
+# (first digit 2-9), filled straight from the matched digit groups
+_NANP_NUMBER_PATTERN = re.compile(r'\+1([2-9][0-9]{2})([0-9]{3})([0-9]{4})')
+_NANP_TEMPLATES = {
+    PhoneFormat.INTERNATIONAL.value: "+1 {}-{}-{}",
+    PhoneFormat.NATIONAL.value: "({}) {}-{}",
 }
 
 
+@lru_cache(maxsize=4096)
+def _format_phone_number(number: str, phone_format: str) -> str:
+    """Render an E.164 number in ``phone_format``, leaving it unchanged if it can't be parsed."""
+    # A +1 number with ten national digits is already in its E.164 form
+    if phone_format == _E164 and len(number) == 12 and number.startswith("+1") and number[2:].isdecimal() and number.isascii():
+        return number
+    match = _NANP_NUMBER_PATTERN.fullmatch(number)
+    if match and phone_format in _NANP_TEMPLATES:
+        return _NANP_TEMPLATES[phone_format].format(*match.groups())
+    try:
+        parsed = phonenumbers.parse(number, None)
+    except phonenumbers.NumberParseException:
+        return number
+    return phonenumbers.format_number(parsed, _PHONE_NUMBER_FORMATS[phone_format])
+
+
+def _search_cost(result: Any) -> float:
+    """Return what a search was billed, from its pricing breakdown if present."""
+    pricing = getattr(result, "pricing", None)
+    if pricing is not None:
+        return pricing.total_cost
+    return result.search_cost or 0.0
+
+
 class SearchAPI:
     """
     A comprehensive client for the Search API with enhanced error handling,
@@ -102,7 +204,25 @@ class SearchAPI:
             config = SearchAPIConfig(api_key=api_key)
         
         self.config = config
+        self._rate_limiter = RateLimiter(max_wait=config.rate_limit_max_wait)
+        self._token_bucket = (
+            TokenBucket(rate=config.rate_limit_qps, burst=config.rate_limit_burst)
+            if config.rate_limit_qps
+            else None
+        )
         self.session = self._create_session()
+        self._cache = (
+            ResponseCache(max_size=config.max_cache_size, ttl=config.cache_ttl)
+            if config.enable_caching
+            else None
+        )
+        self._balance: Optional[BalanceInfo] = None
+        self._balance_expires_at = 0.0
+        self._balance_lock = threading.Lock()
+        
+        # GET endpoints whose query never changes, built once per client
+        self._balance_url = f"{config.base_url}?action=get_balance&api_key={config.api_key}"
+        self._access_logs_url = f"{config.base_url}?action=get_access_logs&api_key={config.api_key}"
         
         self.STREET_TYPE_MAP = {
             "st": "Street", "ave": "Avenue", "blvd": "Boulevard", "rd": "Road",
@@ -128,18 +248,22 @@ class SearchAPI:
         """Create and configure the HTTP session with connection pooling."""
         session = Session()
 
+        # Once retries are exhausted the last response is returned rather
+        # than raised, so _make_request still maps it to ServerError.
         retry_strategy = Retry(
             total=self.config.max_retries,
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "POST"],
+            status_forcelist=_RETRY_STATUS_CODES,
+            allowed_methods=_RETRY_METHODS,
             backoff_factor=0.5,
+            respect_retry_after_header=False,
+            raise_on_status=False,
         )
         
         # Configure connection pooling for better performance
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
             pool_connections=10,
-            pool_maxsize=20,
+            pool_maxsize=self.config.pool_maxsize,
             pool_block=False
         )
         session.mount("http://", adapter)
@@ -150,14 +274,30 @@ class SearchAPI:
             "Accept": "application/json",
             "Accept-Encoding": "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate",
             "Content-Type": "application/x-www-form-urlencoded",
+            "Connection": "keep-alive",
         })
         
         if self.config.proxy:
             session.proxies.update(self.config.proxy)
         
+        # Track the server's rate-limit headers on every response
+        session.hooks["response"].append(self._record_rate_limit)
+        
         return session
     
-    def _validate_email(self, email: str, raise_error: bool = False) -> bool:
+    def _record_rate_limit(self, response: Response, *args, **kwargs) -> None:
+        """Response hook feeding rate-limit headers to the rate limiter."""
+        self._rate_limiter.update(response.headers)
+    
+    def _throttle(self) -> None:
+        """Wait until both the client-side and server-side rate limits allow a request."""
+        waited = self._token_bucket.acquire() if self._token_bucket is not None else 0.0
+        waited += self._rate_limiter.wait()
+        if waited and self.config.debug_mode:
+            logger.debug(f"Throttled request for {waited:.2f}s to stay within rate limits")
+    
+    @staticmethod
+    def _validate_email(email: str, raise_error: bool = False) -> bool:
         """
         Validate email format.
         
@@ -176,14 +316,15 @@ class SearchAPI:
                 raise ValidationError("Email address is required and must be a string")
             return False
         
-        if not _EMAIL_PATTERN.match(email):
+        if not _EMAIL_PATTERN.fullmatch(email):
             if raise_error:
                 raise ValidationError(f"Invalid email format: {email}")
             return False
         
         return True
     
-    def _validate_phone(self, phone: str, raise_error: bool = False) -> bool:
+    @staticmethod
+    def _validate_phone(phone: str, raise_error: bool = False) -> bool:
         """
         Validate phone number format.
         
@@ -219,7 +360,8 @@ class SearchAPI:
             raise ValidationError(f"Invalid phone number format: {phone}")
         return False
     
-    def _validate_domain(self, domain: str, raise_error: bool = False) -> bool:
+    @staticmethod
+    def _validate_domain(domain: str, raise_error: bool = False) -> bool:
         """
         Validate domain format.
         
@@ -240,7 +382,10 @@ class SearchAPI:
         
         domain = domain.lower().strip()
         
-        # Optimize domain validation
+        if _DOMAIN_PATTERN.fullmatch(domain):
+            return True
+        
+        # Slow path: find out what is wrong (or accept non-ASCII labels)
         domain_clean = domain.replace(".", "").replace("-", "")
         if not domain_clean.isalnum():
             if raise_error:
@@ -271,6 +416,21 @@ class SearchAPI:
         
         return True
     
+    @staticmethod
+    def is_valid_email(email: str) -> bool:
+        """Check an email address against the rules ``search_email`` applies, without a request."""
+        return SearchAPI._validate_email(email)
+    
+    @staticmethod
+    def is_valid_phone(phone: str) -> bool:
+        """Check a phone number against the rules ``search_phone`` applies, without a request."""
+        return SearchAPI._validate_phone(phone)
+    
+    @staticmethod
+    def is_valid_domain(domain: str) -> bool:
+        """Check a domain against the rules ``search_domain`` applies, without a request."""
+        return SearchAPI._validate_domain(domain)
+    
     def _check_balance(self, required_credits: int = 1) -> None:
         """Check if account has sufficient balance for the operation."""
         try:
@@ -287,22 +447,46 @@ class SearchAPI:
             if self.config.debug_mode:
                 logger.warning(f"Could not verify balance: {e}")
     
-    def get_balance(self) -> BalanceInfo:
+    def get_balance(self, refresh: bool = False) -> BalanceInfo:
         """
         Get current account balance using the correct API endpoint.
         
+        When ``balance_cache_ttl`` is configured, a recently fetched balance
+        is reused, with the cost of each search made since deducted locally.
+        
+        Args:
+            refresh: Always fetch the balance from the server
+            
         Returns:
             BalanceInfo object with current balance details
             
         Raises:
             SearchAPIError: If balance check fails
         """
+        ttl = self.config.balance_cache_ttl
+        if ttl and not refresh:
+            with self._balance_lock:
+                if self._balance is not None and time.monotonic() < self._balance_expires_at:
+                    return self._balance
+        
+        balance_info = self._fetch_balance()
+        
+        if ttl:
+            with self._balance_lock:
+                self._balance = balance_info
+                self._balance_expires_at = time.monotonic() + ttl
+        
+        return balance_info
+    
+    def _fetch_balance(self) -> BalanceInfo:
+        """Fetch the current account balance from the server."""
         try:
-            balance_url = f"{self.config.base_url}?action=get_balance&api_key={self.config.api_key}"
+            balance_url = self._balance_url
             
             if self.config.debug_mode:
                 logger.debug(f"Making balance request to: {balance_url}")
             
+            self._throttle()
             response = self.session.get(balance_url, timeout=self.config.timeout)
             
             if response.status_code != 200:
@@ -317,7 +501,7 @@ class SearchAPI:
                 current_balance=float(response_data["balance"]),
                 currency="USD",
                 last_updated=datetime.now(),
-                credit_cost_per_search=0.0025
+                credit_cost_per_search=BASE_SEARCH_COST
             )
             
             return balance_info
@@ -327,6 +511,20 @@ class SearchAPI:
                 raise
             raise SearchAPIError(f"Failed to get balance: {str(e)}")
     
+    def _charge_balance(self, cost: float) -> None:
+        """Deduct a search's cost from the cached balance, if one is held."""
+        with self._balance_lock:
+            if self._balance is not None:
+                self._balance = replace(
+                    self._balance,
+                    current_balance=self._balance.current_balance - cost,
+                )
+    
+    def _invalidate_balance(self) -> None:
+        """Drop the cached balance so the next check fetches it again."""
+        with self._balance_lock:
+            self._balance = None
+    
     def get_access_logs(self) -> List[AccessLog]:
         """
         Get access logs using the correct API endpoint.
@@ -337,12 +535,93 @@ class SearchAPI:
         Raises:
             SearchAPIError: If access logs retrieval fails
         """
+        return list(self.iter_access_logs())
+    
+    def iter_access_logs(self, page_size: Optional[int] = None) -> Iterator[AccessLog]:
+        """
+        Iterate over access logs, one page at a time.
+        
+        Entries are yielded as each page arrives, so callers that only need
+        the first few entries can stop early without fetching the rest.
+        
+        Args:
+            page_size: Entries to request per page. When omitted, the server
+                returns all logs in a single response.
+            
+        Yields:
+            AccessLog objects with access information
+            
+        Raises:
+            SearchAPIError: If access logs retrieval fails
+        """
+        for log_entry in self._iter_access_log_entries(page_size):
+            yield self._parse_access_log(log_entry)
+    
+    def get_access_logs_df(self, page_size: Optional[int] = None) -> "pandas.DataFrame":
+        """
+        Get access logs as a pandas DataFrame for bulk analysis.
+        
+        The frame is built straight from the raw log entries, with one column
+        per AccessLog field, and timestamps are parsed for the whole column at
+        once. Aggregations such as ``df["ip_address"].value_counts()`` then run
+        in pandas rather than in a Python loop, which pays off for large logs.
+        
+        Args:
+            page_size: Entries to request per page. When omitted, the server
+                returns all logs in a single response.
+            
+        Returns:
+            DataFrame with one row per access log entry
+            
+        Raises:
+            ConfigurationError: If pandas is not installed
+            SearchAPIError: If access logs retrieval fails
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ConfigurationError(
+                "pandas is required for get_access_logs_df(); "
+                'install it with: pip install "AD-SearchAPI[pandas]"'
+            )
+        
+        df = pd.DataFrame.from_records(
+            list(self._iter_access_log_entries(page_size)),
+            columns=_ACCESS_LOG_COLUMNS,
+        )
+        df["ip_address"] = df["ip_address"].fillna("")
+        df["last_accessed"] = pd.to_datetime(df["last_accessed"], format="ISO8601", errors="coerce")
+        return df
+    
+    def _iter_access_log_entries(self, page_size: Optional[int]) -> Iterator[Dict[str, Any]]:
+        """Yield raw access log entries, following pagination when page_size is set."""
+        if page_size is not None and page_size < 1:
+            raise ValidationError(f"Page size must be at least 1: {page_size}")
+        
+        page = 1
+        while True:
+            response_data = self._fetch_access_logs_page(page, page_size)
+            logs = response_data["logs"]
+            
+            yield from logs
+            
+            # A short page is the last one, whatever the pagination says; this
+            # keeps a server that ignores ``page`` from looping forever
+            if page_size is None or len(logs) < page_size or not self._has_more_pages(response_data, page):
+                return
+            page += 1
+    
+    def _fetch_access_logs_page(self, page: int, page_size: Optional[int]) -> Dict[str, Any]:
+        """Fetch one page of access logs and return the parsed response."""
         try:
-            logs_url = f"{self.config.base_url}?action=get_access_logs&api_key={self.config.api_key}"
+            logs_url = self._access_logs_url
+            if page_size is not None:
+                logs_url += f"&page={page}&limit={page_size}"
             
             if self.config.debug_mode:
                 logger.debug(f"Making access logs request to: {logs_url}")
             
+            self._throttle()
             response = self.session.get(logs_url, timeout=self.config.timeout)
             
             if response.status_code != 200:
@@ -353,26 +632,36 @@ class SearchAPI:
             if "logs" not in response_data:
                 raise ServerError("Invalid access logs response from server")
             
-            access_logs = []
-            for log_entry in response_data["logs"]:
-                access_log = AccessLog(
-                    ip_address=log_entry.get("ip_address", ""),
-                    last_accessed=parse(log_entry["last_accessed"]) if log_entry.get("last_accessed") else None,
-                    user_agent=log_entry.get("user_agent"),
-                    endpoint=log_entry.get("endpoint"),
-                    method=log_entry.get("method"),
-                    status_code=log_entry.get("status_code"),
-                    response_time=log_entry.get("response_time"),
-                )
-                access_logs.append(access_log)
-            
-            return access_logs
+            return response_data
             
         except Exception as e:
             if isinstance(e, SearchAPIError):
                 raise
             raise SearchAPIError(f"Failed to get access logs: {str(e)}")
     
+    @staticmethod
+    def _has_more_pages(response_data: Dict[str, Any], page: int) -> bool:
+        """Check the pagination block of an access logs response."""
+        pagination = response_data.get("pagination")
+        if not isinstance(pagination, dict):
+            return False
+        if "has_more" in pagination:
+            return bool(pagination["has_more"])
+        total_pages = pagination.get("total_pages")
+        return isinstance(total_pages, int) and page < total_pages
+    
+    def _parse_access_log(self, log_entry: Dict[str, Any]) -> AccessLog:
+        """Parse a single access log entry."""
+        return AccessLog(
+            ip_address=log_entry.get("ip_address", ""),
+            last_accessed=_parse_timestamp(log_entry["last_accessed"]) if log_entry.get("last_accessed") else None,
+            user_agent=log_entry.get("user_agent"),
+            endpoint=log_entry.get("endpoint"),
+            method=log_entry.get("method"),
+            status_code=log_entry.get("status_code"),
+            response_time=log_entry.get("response_time"),
+        )
+    
     def _make_request(self, params: Optional[Dict[str, Any]] = None, method: str = "POST") -> Dict[str, Any]:
         """
         Make HTTP request to the API.
@@ -404,6 +693,8 @@ class SearchAPI:
             if self.config.debug_mode:
                 logger.debug(f"Making request to {self.config.base_url} with params: {sanitized_params}")
             
+            self._throttle()
+            
             if method == "POST":
                 response = self.session.post(
                     self.config.base_url,
@@ -454,10 +745,11 @@ class SearchAPI:
                     status_code=402
                 )
             elif response.status_code == 429:
-                raise RateLimitError(
-                    "Rate limit exceeded: Too many requests. Please wait before making additional requests.",
-                    status_code=429
-                )
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                message = "Rate limit exceeded: Too many requests. Please wait before making additional requests."
+                if retry_after is not None:
+                    message += f" Retry after {retry_after:.0f} seconds."
+                raise RateLimitError(message, retry_after=retry_after, status_code=429)
             elif response.status_code >= 500:
                 raise ServerError(
                     f"Server error: The API server encountered an error (HTTP {response.status_code}). "
@@ -485,6 +777,12 @@ class SearchAPI:
             raise NetworkError(
                 f"Request failed: {str(e)}. Please check your network connection and try again."
             )
+        except InsufficientBalanceError:
+            # The locally tracked balance is evidently wrong
+            self._invalidate_balance()
+            raise
+        except SearchAPIError:
+            raise
         except Exception as e:
             raise SearchAPIError(
                 f"Unexpected error occurred: {str(e)}. "
@@ -516,6 +814,17 @@ class SearchAPI:
             elif content_encoding == "deflate":
                 content = zlib.decompress(content)
             
+            # Fast path: orjson parses the raw bytes without a separate decode
+            if ORJSON_AVAILABLE:
+                try:
+                    parsed_data = orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    pass  # Not UTF-8 JSON; fall through to the text path
+                else:
+                    if self.config.debug_mode:
+                        logger.debug(f"Parsed JSON response: {parsed_data}")
+                    return parsed_data
+            
             # Decode content once
             try:
                 text_content = content.decode("utf-8")
@@ -576,16 +885,16 @@ class SearchAPI:
         if not address_str:
             return ""
         
-        # Use pre-compiled patterns for better performance
-        for abbrev, pattern in _STREET_TYPE_PATTERNS.items():
-            if abbrev in self.STREET_TYPE_MAP:
-                address_str = pattern.sub(self.STREET_TYPE_MAP[abbrev], address_str)
+        street_types = self.STREET_TYPE_MAP
+        states = self.STATE_ABBREVIATIONS
         
-        for abbrev, pattern in _STATE_ABBREV_PATTERNS.items():
-            if abbrev in self.STATE_ABBREVIATIONS:
-                address_str = pattern.sub(self.STATE_ABBREVIATIONS[abbrev], address_str)
+        def expand(match: "re.Match[str]") -> str:
+            # Street types take precedence, so "ct" becomes "Court"
+            word = match.group()
+            key = word.casefold()
+            return street_types.get(key) or states.get(key) or word
         
-        return address_str.strip()
+        return _ADDRESS_ABBREV_PATTERN.sub(expand, address_str).strip()
     
     def _parse_address(self, address_data: Union[str, Dict[str, Any]]) -> Address:
         """Parse address data into Address object."""
@@ -595,68 +904,63 @@ class SearchAPI:
         
         if isinstance(address_data, dict):
             if "address" in address_data:
-                street = address_data.get("address", "")
                 zestimate = address_data.get("zestimate")
-                zpid = address_data.get("zpid")
                 
                 property_details = address_data.get("property_details", {})
                 if not isinstance(property_details, dict):
                     property_details = {}
                 
-                bedrooms = property_details.get("bedrooms") if isinstance(property_details, dict) else None
-                bathrooms = property_details.get("bathrooms") if isinstance(property_details, dict) else None
-                living_area = property_details.get("living_area") if isinstance(property_details, dict) else None
-                home_status = property_details.get("home_status") if isinstance(property_details, dict) else None
-                
                 # Check if components exist in property_details or address_data
-                components = None
-                if isinstance(property_details, dict):
-                    components = property_details.get("components")
+                components = property_details.get("components")
                 if not components and isinstance(address_data.get("components"), dict):
                     components = address_data.get("components")
                 elif not isinstance(components, dict):
-                    components = None
+                    components = {}
                 
                 return Address(
-                    street=self._format_address(street),
-                    city=(property_details.get("city") if isinstance(property_details, dict) else None) or (components.get("city") if isinstance(components, dict) and components else None),
-                    state=(property_details.get("state") if isinstance(property_details, dict) else None) or (components.get("state") if isinstance(components, dict) and components else None),
-                    postal_code=(property_details.get("zipcode") if isinstance(property_details, dict) else None) or (components.get("postal_code") if isinstance(components, dict) and components else None),
-                    country=components.get("country") if isinstance(components, dict) and components else None,
-                    zestimate=Decimal(str(zestimate)) if zestimate else None,
-                    zpid=zpid,
-                    bedrooms=bedrooms,
-                    bathrooms=bathrooms,
-                    living_area=living_area,
-                    home_status=home_status,
-                    state_code=components.get("state_code") if isinstance(components, dict) and components else None,
-                    zip_code=components.get("zip_code") if isinstance(components, dict) and components else None,
-                    zip4=components.get("zip4") if isinstance(components, dict) and components else None,
-                    county=components.get("county") if isinstance(components, dict) and components else None,
+                    street=self._format_address(address_data.get("address", "")),
+                    city=property_details.get("city") or components.get("city"),
+                    state=property_details.get("state") or components.get("state"),
+                    postal_code=property_details.get("zipcode") or components.get("postal_code"),
+                    country=components.get("country"),
+                    zestimate=_to_decimal(zestimate) if zestimate else None,
+                    zpid=address_data.get("zpid"),
+                    bedrooms=property_details.get("bedrooms"),
+                    bathrooms=property_details.get("bathrooms"),
+                    living_area=property_details.get("living_area"),
+                    home_status=property_details.get("home_status"),
+                    state_code=components.get("state_code"),
+                    zip_code=components.get("zip_code"),
+                    zip4=components.get("zip4"),
+                    county=components.get("county"),
                 )
             else:
                 # Check if this is a structured address with components
+                # An empty mapping stands in for missing components, so each
+                # field below costs one lookup instead of repeated type checks
                 components = address_data.get("components")
                 if not isinstance(components, dict):
-                    components = None
+                    components = {}
+                zestimate = address_data.get("zestimate")
+                last_known = address_data.get("last_known")
                 
                 return Address(
                     street=self._format_address(address_data.get("street", "")),
-                    city=address_data.get("city") or (components.get("city") if isinstance(components, dict) and components else None),
-                    state=address_data.get("state") or (components.get("state") if isinstance(components, dict) and components else None),
-                    postal_code=address_data.get("postal_code") or (components.get("postal_code") if isinstance(components, dict) and components else None),
-                    country=address_data.get("country") or (components.get("country") if isinstance(components, dict) and components else None),
-                    zestimate=Decimal(str(address_data["zestimate"])) if address_data.get("zestimate") else None,
+                    city=address_data.get("city") or components.get("city"),
+                    state=address_data.get("state") or components.get("state"),
+                    postal_code=address_data.get("postal_code") or components.get("postal_code"),
+                    country=address_data.get("country") or components.get("country"),
+                    zestimate=_to_decimal(zestimate) if zestimate else None,
                     zpid=address_data.get("zpid"),
                     bedrooms=address_data.get("bedrooms"),
                     bathrooms=address_data.get("bathrooms"),
                     living_area=address_data.get("living_area"),
                     home_status=address_data.get("home_status"),
-                    last_known_date=parse(address_data["last_known"]).date() if address_data.get("last_known") else None,
-                    state_code=address_data.get("state_code") or (components.get("state_code") if isinstance(components, dict) and components else None),
-                    zip_code=address_data.get("zip_code") or (components.get("zip_code") if isinstance(components, dict) and components else None),
-                    zip4=address_data.get("zip4") or (components.get("zip4") if isinstance(components, dict) and components else None),
-                    county=address_data.get("county") or (components.get("county") if isinstance(components, dict) and components else None),
+                    last_known_date=_parse_timestamp(last_known).date() if last_known else None,
+                    state_code=address_data.get("state_code") or components.get("state_code"),
+                    zip_code=address_data.get("zip_code") or components.get("zip_code"),
+                    zip4=address_data.get("zip4") or components.get("zip4"),
+                    county=address_data.get("county") or components.get("county"),
                 )
         
         return Address(street="")
@@ -718,7 +1022,7 @@ class SearchAPI:
         
         return Person(
             name=person_data.get("name"),
-            dob=parse(person_data["dob"]).date() if person_data.get("dob") else None,
+            dob=_parse_timestamp(person_data["dob"]).date() if person_data.get("dob") else None,
             age=person_data.get("age"),
         )
     
@@ -848,6 +1152,7 @@ class SearchAPI:
         carrier_info: bool = False,
         tlo_enrichment: bool = False,
         phone_format: str = "international",
+        no_cache: bool = False,
     ) -> EmailSearchResult:
         """
         Search for information by email address.
@@ -859,6 +1164,7 @@ class SearchAPI:
             carrier_info: Include carrier information (+$0.0005)
             tlo_enrichment: Include TLO enrichment data (+$0.0030)
             phone_format: Format for phone numbers (string or PhoneFormat enum)
+            no_cache: Bypass the response cache for this call
             
         Returns:
             EmailSearchResult object with search results
@@ -874,6 +1180,11 @@ class SearchAPI:
         if isinstance(phone_format, PhoneFormat):
             phone_format = phone_format.value
         
+        cache_key = (SearchType.EMAIL, email, house_value, extra_info, carrier_info, tlo_enrichment, phone_format)
+        cached = self._get_cached(cache_key, no_cache)
+        if cached is not None:
+            return cached
+        
         params = {
             "api_key": self.config.api_key,
             "email": email,
@@ -890,7 +1201,10 @@ class SearchAPI:
         
         response_data = self._make_request(params, method="GET")
         
-        return self._parse_email_response(email, response_data)
+        result = self._parse_email_response(email, response_data)
+        self._charge_balance(_search_cost(result))
+        self._store_cached(cache_key, result, no_cache)
+        return result
     
     def _parse_email_response(self, email: str, response_data: Dict[str, Any]) -> EmailSearchResult:
         """Parse email search response."""
@@ -959,7 +1273,7 @@ class SearchAPI:
                     emails=[],
                     search_timestamp=datetime.now(),
                     total_results=0,
-                    search_cost=0.0025,
+                    search_cost=BASE_SEARCH_COST,
                     email_valid=True,
                     email_type=None
                 )
@@ -968,17 +1282,17 @@ class SearchAPI:
             error_msg = response_data["error"]
             if "No data found" in error_msg:
                 pricing_info = None
-                search_cost = 0.0025
+                search_cost = BASE_SEARCH_COST
                 if "_pricing" in response_data:
                     pricing_data = response_data["_pricing"]
                     if isinstance(pricing_data, dict):
                         pricing_info = PricingInfo(
-                            search_cost=pricing_data.get("search_cost", 0.0025),
+                            search_cost=pricing_data.get("search_cost", BASE_SEARCH_COST),
                             extra_info_cost=pricing_data.get("extra_info_cost", 0.0),
                             zestimate_cost=pricing_data.get("zestimate_cost", 0.0),
                             carrier_cost=pricing_data.get("carrier_cost", 0.0),
                             tlo_enrichment_cost=pricing_data.get("tlo_enrichment_cost", 0.0),
-                            total_cost=pricing_data.get("total_cost", pricing_data.get("search_cost", 0.0025)),
+                            total_cost=pricing_data.get("total_cost", pricing_data.get("search_cost", BASE_SEARCH_COST)),
                         )
                         search_cost = pricing_info.total_cost
                 
@@ -1106,18 +1420,18 @@ class SearchAPI:
         confirmed_numbers = response_data.get("confirmed_numbers", [])
         
         # Extract pricing from _pricing object if available
-        search_cost = 0.0025  # Default
+        search_cost = BASE_SEARCH_COST  # Default
         pricing_info = None
         if "_pricing" in response_data:
             pricing_data = response_data["_pricing"]
             if isinstance(pricing_data, dict):
                 pricing_info = PricingInfo(
-                    search_cost=pricing_data.get("search_cost", 0.0025),
+                    search_cost=pricing_data.get("search_cost", BASE_SEARCH_COST),
                     extra_info_cost=pricing_data.get("extra_info_cost", 0.0),
                     zestimate_cost=pricing_data.get("zestimate_cost", 0.0),
                     carrier_cost=pricing_data.get("carrier_cost", 0.0),
                     tlo_enrichment_cost=pricing_data.get("tlo_enrichment_cost", 0.0),
-                    total_cost=pricing_data.get("total_cost", pricing_data.get("search_cost", 0.0025)),
+                    total_cost=pricing_data.get("total_cost", pricing_data.get("search_cost", BASE_SEARCH_COST)),
                 )
                 search_cost = pricing_info.total_cost
         
@@ -1195,6 +1509,7 @@ class SearchAPI:
         carrier_info: bool = False,
         tlo_enrichment: bool = False,
         phone_format: str = "international",
+        no_cache: bool = False,
     ) -> List[PhoneSearchResult]:
         """
         Search for information by phone number.
@@ -1206,6 +1521,7 @@ class SearchAPI:
             carrier_info: Include carrier information (+$0.0005)
             tlo_enrichment: Include TLO enrichment data (+$0.0030)
             phone_format: Format for phone numbers (string or PhoneFormat enum)
+            no_cache: Bypass the response cache for this call
             
         Returns:
             List of PhoneSearchResult objects with search results
@@ -1224,6 +1540,11 @@ class SearchAPI:
         # Optimize phone formatting
         formatted_phone = phone.replace('%2B', '+').replace('%2b', '+')
         
+        cache_key = (SearchType.PHONE, formatted_phone, house_value, extra_info, carrier_info, tlo_enrichment, phone_format)
+        cached = self._get_cached(cache_key, no_cache)
+        if cached is not None:
+            return cached
+        
         params = {
             "api_key": self.config.api_key,
             "phone": formatted_phone,
@@ -1240,7 +1561,63 @@ class SearchAPI:
         
         response_data = self._make_request(params, method="GET")
         
-        return self._parse_phone_response(phone, response_data)
+        results = self._parse_phone_response(phone, response_data)
+        self._charge_balance(_search_cost(results[0]) if results else BASE_SEARCH_COST)
+        self._store_cached(cache_key, results, no_cache)
+        return results
+    
+    def search_phone_multi_format(
+        self,
+        phone: str,
+        formats: Optional[List[Union[str, PhoneFormat]]] = None,
+        **kwargs,
+    ) -> Dict[str, List[PhoneSearchResult]]:
+        """
+        Search for a phone number once and render the results in several formats.
+        
+        The number is looked up a single time and each format is produced
+        locally with ``phonenumbers``, so asking for three formats costs one
+        request and one search charge instead of three.
+        
+        Args:
+            phone: Phone number to search for (must start with +1)
+            formats: Formats to render (strings or PhoneFormat enums).
+                Defaults to every PhoneFormat.
+            **kwargs: Options passed to ``search_phone``, other than
+                ``phone_format``; choose output formats with ``formats``
+            
+        Returns:
+            Mapping of format name to the search results, with each result's
+            ``phone.number`` written in that format
+            
+        Raises:
+            ValidationError: If the phone number or a format is invalid, or
+                ``phone_format`` is given
+            SearchAPIError: For other API errors
+        """
+        if "phone_format" in kwargs:
+            raise ValidationError(
+                "search_phone_multi_format does not take phone_format; pass the output formats as formats"
+            )
+        if formats is None:
+            formats = list(PhoneFormat)
+        format_names = [f.value if isinstance(f, PhoneFormat) else f for f in formats]
+        for format_name in format_names:
+            if format_name not in _PHONE_NUMBER_FORMATS:
+                raise ValidationError(f"Unsupported phone format: {format_name}")
+        
+        results = self.search_phone(phone, phone_format=PhoneFormat.E164, **kwargs)
+        
+        return {
+            format_name: [
+                replace(result, phone=replace(
+                    result.phone,
+                    number=_format_phone_number(result.phone.number, format_name),
+                ))
+                for result in results
+            ]
+            for format_name in format_names
+        }
     
     def _parse_phone_response(self, phone: str, response_data: Dict[str, Any]) -> List[PhoneSearchResult]:
         """Parse phone search response."""
@@ -1258,18 +1635,18 @@ class SearchAPI:
             else:
                 raise SearchAPIError(f"Phone search failed: {error_msg}")
         
-        default_cost = 0.0025
+        default_cost = BASE_SEARCH_COST
         pricing_info = None
         if "_pricing" in response_data:
             pricing_data = response_data["_pricing"]
             if isinstance(pricing_data, dict):
                 pricing_info = PricingInfo(
-                    search_cost=pricing_data.get("search_cost", 0.0025),
+                    search_cost=pricing_data.get("search_cost", BASE_SEARCH_COST),
                     extra_info_cost=pricing_data.get("extra_info_cost", 0.0),
                     zestimate_cost=pricing_data.get("zestimate_cost", 0.0),
                     carrier_cost=pricing_data.get("carrier_cost", 0.0),
                     tlo_enrichment_cost=pricing_data.get("tlo_enrichment_cost", 0.0),
-                    total_cost=pricing_data.get("total_cost", pricing_data.get("search_cost", 0.0025)),
+                    total_cost=pricing_data.get("total_cost", pricing_data.get("search_cost", BASE_SEARCH_COST)),
                 )
                 default_cost = pricing_info.total_cost
         
@@ -1405,7 +1782,7 @@ class SearchAPI:
             emails=emails,
             search_timestamp=datetime.now(),
             total_results=total_results,
-            search_cost=0.0025,  # Will be set by caller
+            search_cost=BASE_SEARCH_COST,  # Will be set by caller
             censored_numbers=censored_numbers,
             addresses_structured=addresses_structured,
             alternative_names=alternative_names,
@@ -1418,12 +1795,13 @@ class SearchAPI:
             confirmed_numbers=confirmed_numbers,
         )
     
-    def search_domain(self, domain: str) -> DomainSearchResult:
+    def search_domain(self, domain: str, no_cache: bool = False) -> DomainSearchResult:
         """
         Search for information by domain name.
         
         Args:
             domain: Domain name to search for
+            no_cache: Bypass the response cache for this call
             
         Returns:
             DomainSearchResult object with search results
@@ -1435,6 +1813,11 @@ class SearchAPI:
         # Validate domain and raise error if invalid
         self._validate_domain(domain, raise_error=True)
         
+        cache_key = (SearchType.DOMAIN, domain)
+        cached = self._get_cached(cache_key, no_cache)
+        if cached is not None:
+            return cached
+        
         params = {
             "api_key": self.config.api_key,
             "domain": domain,
@@ -1442,7 +1825,10 @@ class SearchAPI:
         
         response_data = self._make_request(params, method="GET")
         
-        return self._parse_domain_response(domain, response_data)
+        result = self._parse_domain_response(domain, response_data)
+        self._charge_balance(_search_cost(result))
+        self._store_cached(cache_key, result, no_cache)
+        return result
     
     def _parse_domain_response(self, domain: str, response_data: Dict[str, Any]) -> DomainSearchResult:
         """Parse domain search response."""
@@ -1453,11 +1839,11 @@ class SearchAPI:
         
         if "error" in response_data:
             error_msg = response_data["error"]
-            search_cost = 0.0025
+            search_cost = BASE_SEARCH_COST
             if "_pricing" in response_data:
                 pricing = response_data["_pricing"]
                 if isinstance(pricing, dict):
-                    search_cost = pricing.get("total_cost", pricing.get("search_cost", 0.0025))
+                    search_cost = pricing.get("total_cost", pricing.get("search_cost", BASE_SEARCH_COST))
             
             if "No data found" in error_msg:
                 pricing_info = None
@@ -1465,12 +1851,12 @@ class SearchAPI:
                     pricing_data = response_data["_pricing"]
                     if isinstance(pricing_data, dict):
                         pricing_info = PricingInfo(
-                            search_cost=pricing_data.get("search_cost", 0.0025),
+                            search_cost=pricing_data.get("search_cost", BASE_SEARCH_COST),
                             extra_info_cost=pricing_data.get("extra_info_cost", 0.0),
                             zestimate_cost=pricing_data.get("zestimate_cost", 0.0),
                             carrier_cost=pricing_data.get("carrier_cost", 0.0),
                             tlo_enrichment_cost=pricing_data.get("tlo_enrichment_cost", 0.0),
-                            total_cost=pricing_data.get("total_cost", pricing_data.get("search_cost", 0.0025)),
+                            total_cost=pricing_data.get("total_cost", pricing_data.get("search_cost", BASE_SEARCH_COST)),
                         )
                         search_cost = pricing_info.total_cost
                 
@@ -1486,18 +1872,18 @@ class SearchAPI:
             else:
                 raise SearchAPIError(f"Domain search failed: {error_msg}")
         
-        search_cost = 0.0025
+        search_cost = BASE_SEARCH_COST
         pricing_info = None
         if "_pricing" in response_data:
             pricing_data = response_data["_pricing"]
             if isinstance(pricing_data, dict):
                 pricing_info = PricingInfo(
-                    search_cost=pricing_data.get("search_cost", 0.0025),
+                    search_cost=pricing_data.get("search_cost", BASE_SEARCH_COST),
                     extra_info_cost=pricing_data.get("extra_info_cost", 0.0),
                     zestimate_cost=pricing_data.get("zestimate_cost", 0.0),
                     carrier_cost=pricing_data.get("carrier_cost", 0.0),
                     tlo_enrichment_cost=pricing_data.get("tlo_enrichment_cost", 0.0),
-                    total_cost=pricing_data.get("total_cost", pricing_data.get("search_cost", 0.0025)),
+                    total_cost=pricing_data.get("total_cost", pricing_data.get("search_cost", BASE_SEARCH_COST)),
                 )
                 search_cost = pricing_info.total_cost
         
@@ -1590,11 +1976,117 @@ class SearchAPI:
             emails=emails,
             search_timestamp=datetime.now(),
             total_results=len(addresses) + len(phone_numbers),
-            search_cost=0.0025,
+            search_cost=BASE_SEARCH_COST,
             email_valid=result_data.get("email_valid", True),
             email_type=result_data.get("email_type")
         )
     
+    def search_email_batch(self, emails: List[str], **kwargs) -> List[BatchSearchResult]:
+        """
+        Search for several email addresses.
+        
+        Args:
+            emails: Email addresses to search for
+            **kwargs: Options passed to ``search_email`` for every address
+            
+        Returns:
+            One BatchSearchResult per email, in input order
+        """
+        return self._search_batch(self.search_email, emails, **kwargs)
+    
+    def search_phone_batch(self, phones: List[str], **kwargs) -> List[BatchSearchResult]:
+        """
+        Search for several phone numbers.
+        
+        Args:
+            phones: Phone numbers to search for
+            **kwargs: Options passed to ``search_phone`` for every number
+            
+        Returns:
+            One BatchSearchResult per phone number, in input order. Each
+            successful ``result`` is a list of PhoneSearchResult objects.
+        """
+        return self._search_batch(self.search_phone, phones, **kwargs)
+    
+    def search_domain_batch(self, domains: List[str], **kwargs) -> List[BatchSearchResult]:
+        """
+        Search for several domains.
+        
+        Args:
+            domains: Domain names to search for
+            **kwargs: Options passed to ``search_domain`` for every domain
+            
+        Returns:
+            One BatchSearchResult per domain, in input order
+        """
+        return self._search_batch(self.search_domain, domains, **kwargs)
+    
+    def _search_batch(self, search_func, queries: List[str], **kwargs) -> List[BatchSearchResult]:
+        """
+        Run ``search_func`` for every query over the pooled session.
+        
+        The API has no batch endpoint, so queries are dispatched concurrently
+        on at most MAX_BATCH_WORKERS threads. Each worker picks up the next
+        query as soon as it finishes, and results are put back in input
+        order. Errors are captured per query instead of aborting the whole
+        batch.
+        """
+        if not queries:
+            return []
+        
+        results: List[Optional[BatchSearchResult]] = [None] * len(queries)
+        with ThreadPoolExecutor(max_workers=min(len(queries), MAX_BATCH_WORKERS)) as executor:
+            futures = {
+                executor.submit(self._search_with_retry, search_func, query, **kwargs): index
+                for index, query in enumerate(queries)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = BatchSearchResult(query=queries[index], result=future.result())
+                except SearchAPIError as e:
+                    results[index] = BatchSearchResult(query=queries[index], error=e)
+        
+        return results
+    
+    def _search_with_retry(self, search_func, query: str, **kwargs) -> Any:
+        """
+        Run one batch search, retrying rate limits and transient network failures.
+        
+        HTTP 429 waits for the server's Retry-After when given; network errors
+        and timeouts back off exponentially. Every wait is capped at
+        ``rate_limit_max_wait``.
+        """
+        for attempt in range(MAX_BATCH_RETRIES + 1):
+            try:
+                return search_func(query, **kwargs)
+            except (RateLimitError, NetworkError, TimeoutError) as e:
+                if attempt == MAX_BATCH_RETRIES:
+                    raise
+                retry_after = getattr(e, "retry_after", None)
+                delay = retry_after if retry_after is not None else 0.5 * 2 ** attempt
+                time.sleep(min(delay, self.config.rate_limit_max_wait))
+    
+    def _get_cached(self, key: tuple, no_cache: bool = False) -> Optional[Any]:
+        """Return a cached search result, or None when caching does not apply."""
+        if self._cache is None or no_cache:
+            return None
+        
+        result = self._cache.get(key)
+        if result is not None and self.config.debug_mode:
+            logger.debug(f"Cache hit for {key[0].value} search: {key[1]}")
+        return result
+    
+    def _store_cached(self, key: tuple, result: Any, no_cache: bool = False) -> None:
+        """Store a search result in the cache if caching is enabled."""
+        if self._cache is not None and not no_cache:
+            self._cache.set(key, result)
+    
+    def clear_cache(self) -> None:
+        """Remove all cached search results."""
+        if self._cache is not None:
+            self._cache.clear()
+    
     def close(self) -> None:
         """Close the client and clean up resources."""
         self.session.close()
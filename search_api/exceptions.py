@@ -43,7 +43,13 @@ class ValidationError(SearchAPIError):
 class RateLimitError(SearchAPIError):
     """Raised when rate limit is exceeded."""
     
-    def __init__(self, message: str = "Rate limit exceeded", **kwargs):
+    def __init__(
+        self,
+        message: str = "Rate limit exceeded",
+        retry_after: Optional[float] = None,
+        **kwargs
+    ):
+        self.retry_after = retry_after
         super().__init__(message, **kwargs)
 
 
@@ -1,20 +1,80 @@
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
 from datetime import date, datetime
 from typing import List, Optional, Union, Dict, Any
 from decimal import Decimal
 from enum import Enum
 import json
 
+# Search pricing in USD
+BASE_SEARCH_COST = 0.0025
+HOUSE_VALUE_COST = 0.0015
+EXTRA_INFO_COST = 0.0015
+CARRIER_INFO_COST = 0.0005
+TLO_ENRICHMENT_COST = 0.0030
+MAX_SEARCH_COST = BASE_SEARCH_COST + HOUSE_VALUE_COST + EXTRA_INFO_COST + CARRIER_INFO_COST + TLO_ENRICHMENT_COST
+
+PRICING = MappingProxyType({
+    "search": BASE_SEARCH_COST,
+    "house_value": HOUSE_VALUE_COST,
+    "extra_info": EXTRA_INFO_COST,
+    "carrier_info": CARRIER_INFO_COST,
+    "tlo_enrichment": TLO_ENRICHMENT_COST,
+})
+
+
+def estimate_search_cost(
+    house_value: bool = False,
+    extra_info: bool = False,
+    carrier_info: bool = False,
+    tlo_enrichment: bool = False,
+) -> float:
+    """Return the cost of a single search with the given options enabled."""
+    cost = BASE_SEARCH_COST
+    if house_value:
+        cost += HOUSE_VALUE_COST
+    if extra_info:
+        cost += EXTRA_INFO_COST
+    if carrier_info:
+        cost += CARRIER_INFO_COST
+    if tlo_enrichment:
+        cost += TLO_ENRICHMENT_COST
+    return cost
+
 # Python 3.10+ supports slots=True in dataclass decorator
 _USE_SLOTS = sys.version_info >= (3, 10)
 
-# Helper to conditionally apply slots
-def _dataclass_with_slots(*args, **kwargs):
-    """Create dataclass with slots if Python 3.10+, otherwise without slots."""
+
+def _add_slots(cls):
+    """
+    Recreate a dataclass with ``__slots__`` for its fields.
+
+    Backport of ``dataclass(slots=True)`` for Python < 3.10. Field defaults
+    live in the generated ``__init__``, so the class attributes holding them
+    can be dropped to make room for the slot descriptors.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+# Helper to apply slots on every supported Python version
+def _dataclass_with_slots(cls=None, **kwargs):
+    """Create a dataclass with slots, natively on Python 3.10+ and via _add_slots before."""
     if _USE_SLOTS:
         kwargs['slots'] = True
-    return dataclass(*args, **kwargs)
+        return dataclass(**kwargs) if cls is None else dataclass(cls, **kwargs)
+    
+    def wrap(cls):
+        return _add_slots(dataclass(cls, **kwargs))
+    
+    return wrap if cls is None else wrap(cls)
 
 
 class PhoneFormat(Enum):
@@ -31,7 +91,7 @@ class SearchType(Enum):
     DOMAIN = "domain"
 
 
-@dataclass
+@_dataclass_with_slots
 class StructuredAddressComponents:
     """Components of a structured address."""
     
@@ -62,7 +122,7 @@ class StructuredAddressComponents:
         }
 
 
-@dataclass
+@_dataclass_with_slots
 class StructuredAddress:
     """Structured address with components."""
     
@@ -146,7 +206,7 @@ class Address:
         }
 
 
-@dataclass
+@_dataclass_with_slots
 class DateObject:
     """Date object with month, day, year."""
     
@@ -163,7 +223,7 @@ class DateObject:
         }
 
 
-@dataclass
+@_dataclass_with_slots
 class PhoneNumberFull:
     """Full phone number information with carrier and metadata."""
     
@@ -208,7 +268,7 @@ class PhoneNumber:
         }
 
 
-@dataclass
+@_dataclass_with_slots
 class NameRecord:
     """Name record with dates and components."""
     
@@ -231,7 +291,7 @@ class NameRecord:
         }
 
 
-@dataclass
+@_dataclass_with_slots
 class DOBRecord:
     """Date of birth record with age and date object."""
     
@@ -248,7 +308,7 @@ class DOBRecord:
         }
 
 
-@dataclass
+@_dataclass_with_slots
 class RelatedPerson:
     """Related person information."""
     
@@ -271,7 +331,7 @@ class RelatedPerson:
         }
 
 
-@dataclass
+@_dataclass_with_slots
 class Crime:
     """Crime information."""
     
@@ -300,7 +360,7 @@ class Crime:
         }
 
 
-@dataclass
+@_dataclass_with_slots
 class CriminalRecord:
     """Criminal record information."""
     
@@ -395,7 +455,7 @@ class AccessLog:
         }
 
 
-@dataclass
+@_dataclass_with_slots
 class BaseSearchResult:
     """Base class for all search results."""
     
@@ -443,7 +503,7 @@ class BaseSearchResult:
         }
 
 
-@dataclass(init=False)
+@_dataclass_with_slots(init=False)
 class EmailSearchResult(BaseSearchResult):
     """Result from email search."""
     
@@ -455,10 +515,11 @@ class EmailSearchResult(BaseSearchResult):
         # Extract email-specific fields
         email_valid = kwargs.pop('email_valid', True)
         email_type = kwargs.pop('email_type', None)
-        search_cost = kwargs.pop('search_cost', 0.0025)  # Default email search cost
+        search_cost = kwargs.pop('search_cost', BASE_SEARCH_COST)  # Default email search cost
         
-        # Initialize parent class
-        super().__init__(**kwargs)
+        # Initialize parent class; the slotted class is rebuilt by the
+        # decorator, so zero-argument super() would see the original
+        super(EmailSearchResult, self).__init__(**kwargs)
         
         # Set email-specific fields
         self.email = email
@@ -468,7 +529,7 @@ class EmailSearchResult(BaseSearchResult):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert email search result to dictionary."""
-        base_dict = super().to_dict()
+        base_dict = super(EmailSearchResult, self).to_dict()
         base_dict.update({
             "email": self.email,
             "email_valid": self.email_valid,
@@ -477,28 +538,28 @@ class EmailSearchResult(BaseSearchResult):
         return base_dict
 
 
-@dataclass(init=False)
+@_dataclass_with_slots(init=False)
 class PhoneSearchResult(BaseSearchResult):
     """Result from phone search."""
     
     phone: PhoneNumber
     
     def __init__(self, phone: PhoneNumber, **kwargs):
-        search_cost = kwargs.pop('search_cost', 0.0025)  # Default phone search cost
-        super().__init__(**kwargs)
+        search_cost = kwargs.pop('search_cost', BASE_SEARCH_COST)  # Default phone search cost
+        super(PhoneSearchResult, self).__init__(**kwargs)
         self.phone = phone
         self.search_cost = search_cost
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert phone search result to dictionary."""
-        base_dict = super().to_dict()
+        base_dict = super(PhoneSearchResult, self).to_dict()
         base_dict.update({
             "phone": self.phone.to_dict(),
         })
         return base_dict
 
 
-@dataclass
+@_dataclass_with_slots
 class DomainSearchResult:
     """Result from domain search."""
     
@@ -514,7 +575,8 @@ class DomainSearchResult:
         self.results = kwargs.get('results', [])
         self.total_results = kwargs.get('total_results', 0)
         self.domain_valid = kwargs.get('domain_valid', True)
-        self.search_cost = kwargs.get('search_cost', 0.0025)  # Domain search cost
+        self.search_cost = kwargs.get('search_cost', BASE_SEARCH_COST)  # Domain search cost
+        self.pricing = kwargs.get('pricing')
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert domain search result to dictionary."""
@@ -528,7 +590,33 @@ class DomainSearchResult:
         }
 
 
-@dataclass
+@_dataclass_with_slots
+class BatchSearchResult:
+    """Outcome of a single query within a batch search."""
+    
+    query: str
+    result: Optional[Any] = None
+    error: Optional[Exception] = None
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the search for this query succeeded."""
+        return self.error is None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert batch search result to dictionary."""
+        if isinstance(self.result, list):
+            result = [item.to_dict() for item in self.result]
+        else:
+            result = self.result.to_dict() if self.result is not None else None
+        return {
+            "query": self.query,
+            "result": result,
+            "error": str(self.error) if self.error else None,
+        }
+
+
+@_dataclass_with_slots
 class SearchAPIConfig:
     """Configuration for the Search API client."""
     
@@ -539,6 +627,14 @@ class SearchAPIConfig:
     proxy: Optional[Dict[str, str]] = None
     debug_mode: bool = False
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+    enable_caching: bool = False
+    cache_ttl: int = 1800  # Seconds a cached search result stays valid
+    max_cache_size: int = 500
+    rate_limit_max_wait: float = 60.0  # Longest pause when the server says the rate limit is used up
+    rate_limit_qps: Optional[float] = None  # Client-side request rate cap; None disables it
+    rate_limit_burst: int = 1
+    balance_cache_ttl: float = 0  # Seconds to reuse a fetched balance; 0 always fetches
+    pool_maxsize: int = 20  # Keep-alive connections kept open; size it to your thread count
     
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -548,6 +644,20 @@ class SearchAPIConfig:
             raise ValueError("Timeout must be positive")
         if self.max_retries < 0:
             raise ValueError("Max retries must be non-negative")
+        if self.cache_ttl <= 0:
+            raise ValueError("Cache TTL must be positive")
+        if self.max_cache_size <= 0:
+            raise ValueError("Max cache size must be positive")
+        if self.rate_limit_max_wait < 0:
+            raise ValueError("Rate limit max wait must be non-negative")
+        if self.rate_limit_qps is not None and self.rate_limit_qps <= 0:
+            raise ValueError("Rate limit QPS must be positive")
+        if self.rate_limit_burst < 1:
+            raise ValueError("Rate limit burst must be at least 1")
+        if self.balance_cache_ttl < 0:
+            raise ValueError("Balance cache TTL must be non-negative")
+        if self.pool_maxsize < 1:
+            raise ValueError("Pool max size must be at least 1")
 
 
 @_dataclass_with_slots
@@ -0,0 +1,161 @@
+import math
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+# X-RateLimit-Reset values above this are Unix timestamps rather than a
+# number of seconds until the window resets
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    """Parse a numeric header value, returning None if missing, malformed or not finite."""
+    if value is None:
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    # float() also accepts "nan" and "inf", which no rate-limit header means
+    return number if math.isfinite(number) else None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into a delay in seconds.
+
+    Args:
+        value: Header value, either a number of seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (never negative), or None if the header is absent or invalid
+    """
+    seconds = _parse_float(value)
+    if seconds is not None:
+        return max(seconds, 0.0)
+    if not value:
+        return None
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RateLimiter:
+    """
+    Paces requests according to the rate limits advertised by the server.
+
+    After each response the limiter records ``X-RateLimit-Remaining``,
+    ``X-RateLimit-Reset`` and ``Retry-After``. Once the server reports that
+    no requests remain, ``wait()`` blocks until the window resets instead of
+    letting the next request fail with HTTP 429.
+    """
+
+    def __init__(self, max_wait: float = 60.0):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            max_wait: Upper bound in seconds for a single wait
+        """
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._remaining: Optional[int] = None
+        self._reset_at: Optional[float] = None
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Record the rate-limit state reported in response headers."""
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        remaining = _parse_float(headers.get("X-RateLimit-Remaining"))
+        reset = _parse_float(headers.get("X-RateLimit-Reset"))
+
+        if retry_after is None and remaining is None:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            if retry_after is not None:
+                self._remaining = 0
+                self._reset_at = now + retry_after
+                return
+
+            self._remaining = int(remaining)
+            if reset is None:
+                self._reset_at = None
+            elif reset > _EPOCH_THRESHOLD:
+                self._reset_at = now + max(reset - time.time(), 0.0)
+            else:
+                self._reset_at = now + reset
+
+    def wait(self) -> float:
+        """
+        Block until a request may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            if self._remaining is None or self._reset_at is None:
+                return 0.0
+
+            now = time.monotonic()
+            if now >= self._reset_at:
+                # The window has reset; wait for fresh headers
+                self._remaining = None
+                self._reset_at = None
+                return 0.0
+
+            if self._remaining > 0:
+                # Count requests locally until the next response updates us
+                self._remaining -= 1
+                return 0.0
+
+            delay = min(self._reset_at - now, self.max_wait)
+
+        time.sleep(delay)
+        return delay
+
+
+class TokenBucket:
+    """
+    Client-side token bucket limiting requests to ``rate`` per second.
+
+    Up to ``burst`` requests may go out back to back; after that each caller
+    reserves the next token and sleeps until it is due. Reserving before
+    sleeping keeps concurrent callers evenly spaced without holding the lock
+    while they wait.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket holds
+        """
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -29,6 +29,12 @@ setup(
         "brotli": [
             "brotli>=1.0.0",
         ],
+        "orjson": [
+            "orjson>=3.9.0",
+        ],
+        "pandas": [
+            "pandas>=2.0.0",
+        ],
     },
     author="Search API Team",
     author_email="support@search-api.dev",
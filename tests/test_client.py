@@ -1,6 +1,10 @@
+import asyncio
+import threading
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, date
+from dataclasses import dataclass, field
 from decimal import Decimal
 
 from search_api import (
@@ -25,7 +29,15 @@ from search_api import (
     AccessLog,
     PhoneFormat,
     SearchType,
+    BatchSearchResult,
+    PRICING,
+    MAX_SEARCH_COST,
+    estimate_search_cost,
 )
+from search_api.aio import AsyncSearchAPI
+from search_api.cache import ResponseCache
+from search_api.models import BaseSearchResult, _add_slots
+from search_api.ratelimit import RateLimiter, TokenBucket, parse_retry_after
 
 
 class TestSearchAPIConfig:
@@ -52,6 +64,18 @@ class TestSearchAPIConfig:
         """Test that negative retries raises error."""
         with pytest.raises(ValueError, match="Max retries must be non-negative"):
             SearchAPIConfig(api_key="test_key", max_retries=-1)
+    
+    def test_invalid_cache_ttl(self):
+        """Test that non-positive cache TTL raises error."""
+        with pytest.raises(ValueError, match="Cache TTL must be positive"):
+            SearchAPIConfig(api_key="test_key", cache_ttl=0)
+    
+    def test_pool_maxsize(self):
+        """Test that pool_maxsize sizes the session's connection pool."""
+        with pytest.raises(ValueError, match="Pool max size must be at least 1"):
+            SearchAPIConfig(api_key="test_key", pool_maxsize=0)
+        client = SearchAPI(config=SearchAPIConfig(api_key="test_key", pool_maxsize=40))
+        assert client.session.get_adapter("https://search-api.dev")._pool_maxsize == 40
 
 
 class TestSearchAPI:
@@ -100,6 +124,21 @@ class TestSearchAPI:
         assert client._validate_domain("") is False
         assert client._validate_domain(None) is False
     
+    def test_validate_rejects_trailing_newline(self, client):
+        """Test that a trailing newline does not slip past validation."""
+        assert client._validate_email("test@example.com\n") is False
+        assert client._validate_domain("sub.example.co.uk") is True
+        assert client._validate_domain("-bad.example.com") is False
+    
+    def test_public_validators(self):
+        """Test the public validators work without a client instance."""
+        assert SearchAPI.is_valid_email("test@example.com") is True
+        assert SearchAPI.is_valid_email("invalid-email") is False
+        assert SearchAPI.is_valid_phone("+1234567890") is True
+        assert SearchAPI.is_valid_phone("invalid-phone") is False
+        assert SearchAPI.is_valid_domain("example.com") is True
+        assert SearchAPI.is_valid_domain("invalid-domain") is False
+    
     @patch.object(SearchAPI, '_parse_response')
     def test_get_balance_success(self, mock_parse_response, client):
         """Test successful balance retrieval."""
@@ -118,6 +157,23 @@ class TestSearchAPI:
             assert balance.credit_cost_per_search == 0.0025
             assert balance.last_updated is not None
     
+    @patch.object(SearchAPI, '_make_request')
+    @patch.object(SearchAPI, '_fetch_balance')
+    def test_get_balance_cached(self, mock_fetch_balance, mock_request):
+        """Test that the balance is reused within its TTL and charged locally."""
+        client = SearchAPI(config=SearchAPIConfig(api_key="test_key", balance_cache_ttl=10))
+        mock_fetch_balance.return_value = BalanceInfo(current_balance=1.0)
+        mock_request.return_value = {"email": "test@example.com", "name": "John Doe"}
+        
+        assert client.get_balance().current_balance == 1.0
+        client.search_email("test@example.com")
+        
+        assert client.get_balance().current_balance == pytest.approx(0.9975)
+        assert mock_fetch_balance.call_count == 1
+        
+        client.get_balance(refresh=True)
+        assert mock_fetch_balance.call_count == 2
+    
     @patch.object(SearchAPI, '_parse_response')
     def test_get_balance_invalid_response(self, mock_parse_response, client):
         """Test balance retrieval with invalid response."""
@@ -160,6 +216,76 @@ class TestSearchAPI:
             assert access_logs[0].ip_address == "54.221.146.102"
             assert access_logs[1].ip_address == "54.158.89.194"
     
+    @patch.object(SearchAPI, '_parse_response')
+    def test_iter_access_logs_paginated(self, mock_parse_response, client):
+        """Test that access logs are fetched page by page until exhausted."""
+        mock_parse_response.side_effect = [
+            {
+                "logs": [{"ip_address": "1.1.1.1"}, {"ip_address": "2.2.2.2"}],
+                "pagination": {"page": 1, "total_pages": 2},
+            },
+            {
+                "logs": [{"ip_address": "3.3.3.3"}],
+                "pagination": {"page": 2, "total_pages": 2},
+            },
+        ]
+        
+        with patch.object(client.session, 'get') as mock_get:
+            mock_get.return_value = Mock(status_code=200)
+            
+            logs = list(client.iter_access_logs(page_size=2))
+            
+            assert [log.ip_address for log in logs] == ["1.1.1.1", "2.2.2.2", "3.3.3.3"]
+            assert mock_get.call_count == 2
+            assert "page=2&limit=2" in mock_get.call_args[0][0]
+    
+    @patch.object(SearchAPI, '_parse_response')
+    def test_iter_access_logs_stops_on_empty_page(self, mock_parse_response, client):
+        """Test that pagination ends on an empty page even if has_more stays true."""
+        mock_parse_response.side_effect = [
+            {"logs": [{"ip_address": "1.1.1.1"}, {"ip_address": "2.2.2.2"}], "pagination": {"has_more": True}},
+            {"logs": [], "pagination": {"has_more": True}},
+        ]
+        
+        with patch.object(client.session, 'get') as mock_get:
+            mock_get.return_value = Mock(status_code=200)
+            
+            logs = list(client.iter_access_logs(page_size=2))
+            
+            assert [log.ip_address for log in logs] == ["1.1.1.1", "2.2.2.2"]
+            assert mock_get.call_count == 2
+        
+        with pytest.raises(ValidationError, match="Page size must be at least 1"):
+            list(client.iter_access_logs(page_size=0))
+    
+    @patch.object(SearchAPI, '_parse_response')
+    def test_get_access_logs_df(self, mock_parse_response, client):
+        """Test access logs returned as a DataFrame with parsed timestamps."""
+        pd = pytest.importorskip("pandas")
+        mock_parse_response.return_value = {
+            "logs": [
+                {"ip_address": "1.1.1.1", "last_accessed": "2025-08-03 21:24:57", "status_code": 200},
+                {"ip_address": "1.1.1.1", "last_accessed": "2025-08-04T09:00:00"},
+                {"last_accessed": "not a date"},
+            ]
+        }
+        
+        with patch.object(client.session, 'get') as mock_get:
+            mock_get.return_value = Mock(status_code=200)
+            
+            df = client.get_access_logs_df()
+        
+        assert list(df.columns) == list(AccessLog.__dataclass_fields__)
+        assert df["ip_address"].tolist() == ["1.1.1.1", "1.1.1.1", ""]
+        assert df["last_accessed"].max() == pd.Timestamp("2025-08-04 09:00:00")
+        assert df["last_accessed"].isna().iloc[2]
+    
+    def test_get_access_logs_df_requires_pandas(self, client):
+        """Test that a missing pandas install is reported clearly."""
+        with patch.dict("sys.modules", {"pandas": None}):
+            with pytest.raises(ConfigurationError, match="pandas is required"):
+                client.get_access_logs_df()
+    
     @patch.object(SearchAPI, '_parse_response')
     def test_get_access_logs_invalid_response(self, mock_parse_response, client):
         """Test access logs retrieval with invalid response."""
@@ -199,6 +325,37 @@ class TestSearchAPI:
         with pytest.raises(ValidationError, match="Invalid email format"):
             client.search_email("invalid-email")
     
+    def test_parse_response_json(self, client):
+        """Test that JSON bodies are decoded, with or without orjson."""
+        response = Mock(status_code=200, headers={}, content='{"name": "José", "age": 33}'.encode("utf-8"))
+        
+        assert client._parse_response(response) == {"name": "José", "age": 33}
+    
+    def test_parse_response_error_text(self, client):
+        """Test that plain-text error bodies map to exceptions."""
+        response = Mock(status_code=200, headers={}, content=b"Error: insufficient balance")
+        
+        with pytest.raises(InsufficientBalanceError):
+            client._parse_response(response)
+    
+    def test_make_request_rate_limited(self, client):
+        """Test that HTTP 429 raises RateLimitError carrying Retry-After."""
+        with patch.object(client.session, 'get') as mock_get:
+            mock_get.return_value = Mock(status_code=429, headers={"Retry-After": "7"})
+            
+            with pytest.raises(RateLimitError) as exc_info:
+                client._make_request({"email": "test@example.com"}, method="GET")
+        
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.retry_after == 7.0
+
+    def test_session_retry_leaves_429_to_client(self, client):
+        """Test that urllib3 never sleeps on Retry-After; 429 waits stay capped."""
+        retries = client.session.get_adapter("https://search-api.dev").max_retries
+        assert 429 not in retries.status_forcelist
+        assert 503 in retries.status_forcelist
+        assert retries.respect_retry_after_header is False
+
     @patch.object(SearchAPI, '_check_balance')
     @patch.object(SearchAPI, '_make_request')
     def test_search_email_success(self, mock_request, mock_check_balance, client):
@@ -273,11 +430,69 @@ class TestSearchAPI:
         assert len(result.phone_numbers) == 1
         assert len(result.emails) == 1
 
+    @patch.object(SearchAPI, '_make_request')
+    def test_search_phone_multi_format(self, mock_request, client):
+        """Test that several formats are rendered from a single search."""
+        mock_request.return_value = {"name": "Jane Smith", "numbers": ["+1987654321"]}
+        
+        by_format = client.search_phone_multi_format(
+            "+12025550123", [PhoneFormat.INTERNATIONAL, "national", PhoneFormat.E164]
+        )
+        
+        assert mock_request.call_count == 1
+        assert by_format["international"][0].phone.number == "+1 202-555-0123"
+        assert by_format["national"][0].phone.number == "(202) 555-0123"
+        assert by_format["e164"][0].phone.number == "+12025550123"
+        
+        with pytest.raises(ValidationError, match="Unsupported phone format"):
+            client.search_phone_multi_format("+12025550123", ["rfc3966"])
+        with pytest.raises(ValidationError, match="pass the output formats as formats"):
+            client.search_phone_multi_format("+12025550123", phone_format="national")
+        assert mock_request.call_count == 1
+
+    def test_phone_format_fast_path_matches_phonenumbers(self):
+        """Test that the NANP shortcut renders numbers exactly as phonenumbers does."""
+        import phonenumbers
+        from search_api.client import _PHONE_NUMBER_FORMATS, _format_phone_number
+
+        for number in ["+12025550123", "+19995550000", "+11234567890", "+10105149426", "+442071838750"]:
+            parsed = phonenumbers.parse(number, None)
+            for format_name, style in _PHONE_NUMBER_FORMATS.items():
+                assert _format_phone_number(number, format_name) == phonenumbers.format_number(parsed, style)
+    
+    def test_parse_person_dob_formats(self, client):
+        """Test that ISO and free-form DOBs parse to the same date."""
+        for dob in ["1990-05-06", "1990-05-06T00:00:00Z", "05/06/1990", "May 6, 1990"]:
+            assert client._parse_person({"name": "John Doe", "dob": dob}).dob == date(1990, 5, 6)
+
+    def test_parse_address_zestimate(self, client):
+        """Test that int, float and string zestimates keep their written value."""
+        for zestimate, expected in [(250000, "250000"), (250000.1, "250000.1"), ("199999.99", "199999.99")]:
+            address = client._parse_address({"address": "123 Main St", "zestimate": zestimate})
+            assert str(address.zestimate) == expected
+
     def test_search_domain_invalid_input(self, client):
         """Test domain search with invalid input."""
         with pytest.raises(ValidationError, match="Invalid domain format"):
             client.search_domain("invalid-domain")
     
+    def test_invalid_input_never_hits_network(self, client):
+        """Test that invalid queries are rejected locally, before any request."""
+        client.session = Mock()
+        
+        for search, query in [
+            (client.search_email, "invalid-email"),
+            (client.search_email, ""),
+            (client.search_phone, "invalid-phone"),
+            (client.search_phone, ""),
+            (client.search_domain, "invalid-domain"),
+            (client.search_domain, ""),
+        ]:
+            with pytest.raises(ValidationError):
+                search(query)
+        
+        assert client.session.method_calls == []
+    
     @patch.object(SearchAPI, '_check_balance')
     @patch.object(SearchAPI, '_make_request')
     def test_search_domain_success(self, mock_request, mock_check_balance, client):
@@ -306,6 +521,79 @@ class TestSearchAPI:
         assert len(result.results) == 1
         assert result.results[0].email == "user1@example.com"
     
+    @patch.object(SearchAPI, '_make_request')
+    def test_search_email_cached(self, mock_request):
+        """Test that repeated searches are served from the cache."""
+        client = SearchAPI(config=SearchAPIConfig(api_key="test_key", enable_caching=True))
+        mock_request.return_value = {"email": "test@example.com", "name": "John Doe"}
+        
+        first = client.search_email("test@example.com")
+        second = client.search_email("test@example.com")
+        
+        assert second is first
+        assert mock_request.call_count == 1
+        
+        # Different options are cached separately
+        client.search_email("test@example.com", extra_info=True)
+        assert mock_request.call_count == 2
+    
+    @patch.object(SearchAPI, '_make_request')
+    def test_search_email_no_cache(self, mock_request):
+        """Test that no_cache bypasses the cache and clear_cache empties it."""
+        client = SearchAPI(config=SearchAPIConfig(api_key="test_key", enable_caching=True))
+        mock_request.return_value = {"email": "test@example.com", "name": "John Doe"}
+        
+        client.search_email("test@example.com")
+        client.search_email("test@example.com", no_cache=True)
+        assert mock_request.call_count == 2
+        
+        client.clear_cache()
+        client.search_email("test@example.com")
+        assert mock_request.call_count == 3
+    
+    @patch.object(SearchAPI, '_make_request')
+    def test_caching_disabled_by_default(self, mock_request, client):
+        """Test that searches hit the API every time without caching."""
+        mock_request.return_value = {"results": [], "domain_valid": True}
+        
+        client.search_domain("example.com")
+        client.search_domain("example.com")
+        
+        assert mock_request.call_count == 2
+    
+    @patch.object(SearchAPI, '_make_request')
+    def test_search_email_batch(self, mock_request, client):
+        """Test batch email search keeps input order and per-item errors."""
+        mock_request.return_value = {"email": "test@example.com", "name": "John Doe"}
+        emails = [f"user{i}@example.com" for i in range(12)] + ["invalid-email"]
+        
+        results = client.search_email_batch(emails, extra_info=True)
+        
+        assert all(isinstance(item, BatchSearchResult) for item in results)
+        assert [item.query for item in results] == emails
+        assert all(item.ok for item in results[:-1])
+        assert isinstance(results[0].result, EmailSearchResult)
+        assert not results[-1].ok
+        assert isinstance(results[-1].error, ValidationError)
+        assert mock_request.call_count == 12
+        assert mock_request.call_args[0][0]["extra_info"] == "True"
+    
+    @patch("search_api.client.time.sleep")
+    @patch.object(SearchAPI, '_make_request')
+    def test_search_email_batch_retries_network_errors(self, mock_request, mock_sleep, client):
+        """Test that batch items retry transient network failures and timeouts."""
+        mock_request.side_effect = [
+            NetworkError("connection reset"),
+            TimeoutError("timed out"),
+            {"email": "test@example.com", "name": "John Doe"},
+        ]
+        
+        results = client.search_email_batch(["test@example.com"])
+        
+        assert results[0].ok
+        assert mock_request.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+    
     def test_close(self, client):
         """Test client cleanup."""
         client.session = Mock()
@@ -324,6 +612,168 @@ class TestSearchAPI:
         client.close.assert_called_once()
 
 
+class TestAsyncSearchAPI:
+    """Test the asyncio front end."""
+    
+    @patch.object(SearchAPI, '_make_request')
+    def test_gather_searches(self, mock_request):
+        """Test that concurrent searches share one client and keep their order."""
+        mock_request.return_value = {"email": "test@example.com", "name": "John Doe"}
+        emails = [f"user{i}@example.com" for i in range(5)]
+        
+        async def run():
+            async with AsyncSearchAPI(api_key="test_key", max_workers=2) as client:
+                return await asyncio.gather(*(client.search_email(email) for email in emails))
+        
+        results = asyncio.run(run())
+        
+        assert all(isinstance(result, EmailSearchResult) for result in results)
+        assert mock_request.call_count == 5
+    
+    def test_errors_propagate(self):
+        """Test that client errors are raised from the awaited call."""
+        async def run():
+            async with AsyncSearchAPI(api_key="test_key") as client:
+                await client.search_email("invalid-email")
+        
+        with pytest.raises(ValidationError):
+            asyncio.run(run())
+    
+    @patch.object(SearchAPI, '_make_request')
+    def test_wraps_existing_client(self, mock_request):
+        """Test that a borrowed client is used as-is and left open."""
+        mock_request.return_value = {"email": "test@example.com", "name": "John Doe"}
+        shared = SearchAPI(api_key="test_key")
+        shared.close = Mock()
+        
+        async def run():
+            async with AsyncSearchAPI(client=shared) as client:
+                assert client.client is shared
+                return await client.search_email("test@example.com")
+        
+        assert isinstance(asyncio.run(run()), EmailSearchResult)
+        shared.close.assert_not_called()
+
+class TestResponseCache:
+    """Test ResponseCache behaviour."""
+    
+    def test_expiry(self):
+        """Test that entries expire after the TTL."""
+        cache = ResponseCache(max_size=10, ttl=60)
+        with patch("search_api.cache.time.monotonic", return_value=1000.0):
+            cache.set("key", "value")
+            assert cache.get("key") == "value"
+        with patch("search_api.cache.time.monotonic", return_value=1061.0):
+            assert cache.get("key") is None
+    
+    def test_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = ResponseCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+    
+    def test_full_cache_drops_expired_entries_first(self):
+        """Test that expired entries make room before live ones are evicted."""
+        cache = ResponseCache(max_size=2, ttl=60)
+        with patch("search_api.cache.time.monotonic", return_value=1000.0):
+            cache.set("old", 1)
+        with patch("search_api.cache.time.monotonic", return_value=1030.0):
+            cache.set("live", 2)
+        with patch("search_api.cache.time.monotonic", return_value=1050.0):
+            cache.get("old")  # most recently used, but stored first
+        with patch("search_api.cache.time.monotonic", return_value=1070.0):
+            cache.set("new", 3)
+            
+            assert len(cache) == 2
+            assert cache.get("old") is None
+            assert cache.get("live") == 2
+            assert cache.get("new") == 3
+
+    def test_concurrent_reads_during_eviction(self):
+        """Test that lock-free reads stay consistent while other threads evict."""
+        cache = ResponseCache(max_size=8, ttl=60)
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(2000):
+                    key = (offset + i) % 32
+                    cache.set(key, key)
+                    value = cache.get((key + 1) % 32)
+                    assert value is None or value == (key + 1) % 32
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(cache) <= 8
+        assert set(cache._data) == set(cache._expiry)
+
+
+class TestRateLimiter:
+    """Test RateLimiter pacing."""
+    
+    def test_no_wait_while_requests_remain(self):
+        """Test that requests pass straight through while quota remains."""
+        limiter = RateLimiter()
+        limiter.update({"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "30"})
+        
+        with patch("search_api.ratelimit.time.sleep") as mock_sleep:
+            assert limiter.wait() == 0.0
+            mock_sleep.assert_not_called()
+    
+    def test_waits_when_exhausted(self):
+        """Test that an exhausted window blocks until reset, capped by max_wait."""
+        limiter = RateLimiter(max_wait=5)
+        limiter.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"})
+        
+        with patch("search_api.ratelimit.time.sleep") as mock_sleep:
+            assert limiter.wait() == 5
+            mock_sleep.assert_called_once_with(5)
+    
+    def test_token_bucket_paces_after_burst(self):
+        """Test that the token bucket allows a burst, then spaces requests."""
+        with patch("search_api.ratelimit.time.monotonic", return_value=100.0), \
+                patch("search_api.ratelimit.time.sleep") as mock_sleep:
+            bucket = TokenBucket(rate=2, burst=2)
+            assert bucket.acquire() == 0.0
+            assert bucket.acquire() == 0.0
+            assert bucket.acquire() == 0.5
+            assert bucket.acquire() == 1.0
+        
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+    
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for seconds and invalid values."""
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("inf") is None
+    
+    def test_ignores_non_finite_headers(self):
+        """Test that "nan"/"inf" header values are ignored instead of raising."""
+        limiter = RateLimiter()
+        limiter.update({"X-RateLimit-Remaining": "nan", "X-RateLimit-Reset": "inf"})
+        limiter.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "nan"})
+        
+        with patch("search_api.ratelimit.time.sleep") as mock_sleep:
+            assert limiter.wait() == 0.0
+            mock_sleep.assert_not_called()
+
+
 class TestExceptions:
     """Test exception classes."""
     
@@ -401,6 +851,14 @@ class TestModels:
         assert person.age == 33
         assert str(person) == "John Doe"
     
+    def test_estimate_search_cost(self):
+        """Test search cost estimation from the pricing table."""
+        assert estimate_search_cost() == PRICING["search"]
+        assert estimate_search_cost(
+            house_value=True, extra_info=True, carrier_info=True, tlo_enrichment=True
+        ) == pytest.approx(MAX_SEARCH_COST)
+        assert estimate_search_cost(carrier_info=True) == pytest.approx(0.0030)
+    
     def test_balance_info_model(self):
         """Test BalanceInfo model."""
         balance = BalanceInfo(
@@ -433,4 +891,31 @@ class TestModels:
         assert access_log.method == "POST"
         assert access_log.status_code == 200
         assert access_log.response_time == 0.5
-        assert "192.168.1.1" in str(access_log) 
\ No newline at end of file
+        assert "192.168.1.1" in str(access_log) 
+    
+    def test_record_models_use_slots(self):
+        """Test that record models carry no per-instance __dict__."""
+        access_log = AccessLog(ip_address="192.168.1.1", last_accessed=None)
+        assert not hasattr(access_log, "__dict__")
+        
+        for result in [
+            BaseSearchResult(),
+            EmailSearchResult(email="test@example.com"),
+            PhoneSearchResult(phone=PhoneNumber(number="+1234567890")),
+            DomainSearchResult(domain="example.com"),
+        ]:
+            assert hasattr(type(result), "__slots__")
+            assert not hasattr(result, "__dict__")
+            assert result.pricing is None
+        assert EmailSearchResult(email="test@example.com").to_dict()["email"] == "test@example.com"
+        
+        @dataclass
+        class Record:
+            name: str
+            tags: list = field(default_factory=list)
+        
+        SlottedRecord = _add_slots(Record)
+        record = SlottedRecord("a")
+        assert SlottedRecord.__slots__ == ("name", "tags")
+        assert record.tags == []
+        assert not hasattr(record, "__dict__")